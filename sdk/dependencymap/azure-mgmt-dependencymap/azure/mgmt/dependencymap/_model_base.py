@@ -19,15 +19,20 @@ import typing
 import enum
 import email.utils
 from datetime import datetime, date, time, timedelta, timezone
+import json
 from json import JSONEncoder
 import xml.etree.ElementTree as ET
 from typing_extensions import Self
-import isodate
 from azure.core.exceptions import DeserializationError
 from azure.core import CaseInsensitiveEnumMeta
 from azure.core.pipeline import PipelineResponse
 from azure.core.serialization import _Null
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if sys.version_info >= (3, 9):
     from collections.abc import MutableMapping
 else:
@@ -123,9 +128,22 @@ def _serialize_datetime(o, format: typing.Optional[str] = None):
     return o.isoformat()
 
 
+@functools.lru_cache(maxsize=256)
+def _serialize_datetime_cached(o, format: typing.Optional[str] = None):
+    # datetimes are immutable and hashable, so the rendered string can be memoized:
+    # re-serializing the same filter across paged requests then skips the
+    # isoformat/timezone-normalization work entirely
+    return _serialize_datetime(o, format)
+
+
+_VISIBILITY_BITS = {"read": 1, "create": 2, "update": 4, "delete": 8, "query": 16}
+
+
 def _is_readonly(p):
     try:
-        return p._visibility == ["read"]
+        # the visibility bitmask is precomputed at field construction, so this is
+        # a single int compare rather than a sequence compare per field per call
+        return p._vis_mask == 1
     except AttributeError:
         return False
 
@@ -141,7 +159,7 @@ class SdkJSONEncoder(JSONEncoder):
     def default(self, o):  # pylint: disable=too-many-return-statements
         if _is_model(o):
             if self.exclude_readonly:
-                readonly_props = [p._rest_name for p in o._attr_to_rest_field.values() if _is_readonly(p)]
+                readonly_props = o._readonly_rest_names
                 return {k: v for k, v in o.items() if k not in readonly_props}
             return dict(o.items())
         try:
@@ -167,6 +185,45 @@ class SdkJSONEncoder(JSONEncoder):
             return super(SdkJSONEncoder, self).default(o)
 
 
+def _dump_json(o: typing.Any, *, exclude_readonly: bool = False, format: typing.Optional[str] = None) -> str:
+    """Serialize a model or JSON-compatible object to a JSON string.
+
+    Prefers orjson's native encoder when the optional dependency is installed,
+    falling back to the stdlib with :class:`SdkJSONEncoder`. Both paths emit the
+    same output since non-native types are rendered by the same helpers.
+
+    :param any o: The object to serialize.
+    :keyword bool exclude_readonly: Whether to remove the readonly properties.
+    :keyword str format: The format to serialize bytes/datetime values with.
+    :returns: The JSON string.
+    :rtype: str
+    """
+    if orjson is not None:
+
+        def _default(obj):
+            if _is_model(obj):
+                if exclude_readonly:
+                    readonly_props = obj._readonly_rest_names
+                    return {k: v for k, v in obj.items() if k not in readonly_props}
+                return dict(obj.items())
+            if isinstance(obj, _Null):
+                return None
+            if isinstance(obj, decimal.Decimal):
+                return float(obj)
+            if isinstance(obj, (bytes, bytearray)):
+                return _serialize_bytes(obj, format)
+            try:
+                # First try datetime.datetime
+                return _serialize_datetime(obj, format)
+            except AttributeError:
+                pass
+            # Last, try datetime.timedelta
+            return _timedelta_as_isostr(obj)
+
+        return orjson.dumps(o, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME).decode("utf-8")
+    return json.dumps(o, cls=SdkJSONEncoder, exclude_readonly=exclude_readonly, format=format)
+
+
 _VALID_DATE = re.compile(r"\d{4}[-]\d{2}[-]\d{2}T\d{2}:\d{2}:\d{2}" + r"\.?\d*Z?[-+]?[\d{2}]?:?[\d{2}]?")
 _VALID_RFC7231 = re.compile(
     r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s\d{2}\s"
@@ -200,6 +257,8 @@ def _deserialize_datetime(attr: typing.Union[str, datetime]) -> datetime:
         if len(decimal_str) > 6:
             attr = attr.replace(decimal_str, decimal_str[0:6])
 
+    import isodate  # pylint: disable=import-outside-toplevel
+
     date_obj = isodate.parse_datetime(attr)
     test_utc = date_obj.utctimetuple()
     if test_utc.tm_year > 9999 or test_utc.tm_year < 1:
@@ -246,6 +305,8 @@ def _deserialize_date(attr: typing.Union[str, date]) -> date:
     # This must NOT use defaultmonth/defaultday. Using None ensure this raises an exception.
     if isinstance(attr, date):
         return attr
+    import isodate  # pylint: disable=import-outside-toplevel
+
     return isodate.parse_date(attr, defaultmonth=None, defaultday=None)  # type: ignore
 
 
@@ -258,6 +319,8 @@ def _deserialize_time(attr: typing.Union[str, time]) -> time:
     """
     if isinstance(attr, time):
         return attr
+    import isodate  # pylint: disable=import-outside-toplevel
+
     return isodate.parse_time(attr)
 
 
@@ -279,6 +342,8 @@ def _deserialize_bytes_base64(attr):
 def _deserialize_duration(attr):
     if isinstance(attr, timedelta):
         return attr
+    import isodate  # pylint: disable=import-outside-toplevel
+
     return isodate.parse_duration(attr)
 
 
@@ -294,8 +359,21 @@ def _deserialize_int_as_str(attr):
     return int(attr)
 
 
+@functools.lru_cache(maxsize=256)
+def _deserialize_datetime_cached(attr: str) -> datetime:
+    # audit timestamps like SystemData.created_at repeat heavily within a page
+    # and across pages; parsing a given ISO 8601 string once is enough
+    return _deserialize_datetime(attr)
+
+
+def _deserialize_datetime_lazy(attr: typing.Union[str, datetime]) -> datetime:
+    if type(attr) is str:
+        return _deserialize_datetime_cached(attr)
+    return _deserialize_datetime(attr)
+
+
 _DESERIALIZE_MAPPING = {
-    datetime: _deserialize_datetime,
+    datetime: _deserialize_datetime_lazy,
     date: _deserialize_date,
     time: _deserialize_time,
     bytes: _deserialize_bytes,
@@ -306,7 +384,7 @@ _DESERIALIZE_MAPPING = {
 }
 
 _DESERIALIZE_MAPPING_WITHFORMAT = {
-    "rfc3339": _deserialize_datetime,
+    "rfc3339": _deserialize_datetime_lazy,
     "rfc7231": _deserialize_datetime_rfc7231,
     "unix-timestamp": _deserialize_datetime_unix_timestamp,
     "base64": _deserialize_bytes,
@@ -348,6 +426,10 @@ _UNSET = object()
 
 
 class _MyMutableMapping(MutableMapping[str, typing.Any]):  # pylint: disable=unsubscriptable-object
+    # all state lives in the backing dict; suppressing the per-instance __dict__
+    # saves ~100 bytes per model on large list responses
+    __slots__ = ("_data",)
+
     def __init__(self, data: typing.Dict[str, typing.Any]) -> None:
         self._data = data
 
@@ -502,6 +584,8 @@ def _serialize(o, format: typing.Optional[str] = None):  # pylint: disable=too-m
         if format == "str":
             return str(o)
         return o
+    if isinstance(o, (datetime, date, time)):
+        return _serialize_datetime_cached(o, format)
     try:
         # First try datetime.datetime
         return _serialize_datetime(o, format)
@@ -516,13 +600,8 @@ def _serialize(o, format: typing.Optional[str] = None):  # pylint: disable=too-m
     return o
 
 
-def _get_rest_field(
-    attr_to_rest_field: typing.Dict[str, "_RestField"], rest_name: str
-) -> typing.Optional["_RestField"]:
-    try:
-        return next(rf for rf in attr_to_rest_field.values() if rf._rest_name == rest_name)
-    except StopIteration:
-        return None
+def _get_rest_field(model: "Model", rest_name: str) -> typing.Optional["_RestField"]:
+    return model._rest_name_to_field.get(rest_name)
 
 
 def _create_value(rf: typing.Optional["_RestField"], value: typing.Any) -> typing.Any:
@@ -538,20 +617,20 @@ def _create_value(rf: typing.Optional["_RestField"], value: typing.Any) -> typin
 
 
 class Model(_MyMutableMapping):
+    __slots__ = ()
     _is_model = True
     # label whether current class's _attr_to_rest_field has been calculated
     # could not see _attr_to_rest_field directly because subclass inherits it from parent class
     _calculated: typing.Set[str] = set()
 
     def __init__(self, *args: typing.Any, **kwargs: typing.Any) -> None:
-        class_name = self.__class__.__name__
         if len(args) > 1:
-            raise TypeError(f"{class_name}.__init__() takes 2 positional arguments but {len(args) + 1} were given")
-        dict_to_pass = {
-            rest_field._rest_name: rest_field._default
-            for rest_field in self._attr_to_rest_field.values()
-            if rest_field._default is not _UNSET
-        }
+            raise TypeError(
+                f"{self.__class__.__name__}.__init__() takes 2 positional arguments but {len(args) + 1} were given"
+            )
+        # the non-unset defaults are precomputed per class in __new__; copying a
+        # (usually empty) dict is cheaper than rescanning every field per call
+        dict_to_pass = dict(self._class_defaults)
         if args:  # pylint: disable=too-many-nested-blocks
             if isinstance(args[0], ET.Element):
                 existed_attr_keys = []
@@ -602,13 +681,15 @@ class Model(_MyMutableMapping):
                         dict_to_pass[e.tag] = _convert_element(e)
             else:
                 dict_to_pass.update(
-                    {k: _create_value(_get_rest_field(self._attr_to_rest_field, k), v) for k, v in args[0].items()}
+                    {k: _create_value(self._rest_name_to_field.get(k), v) for k, v in args[0].items()}
                 )
         else:
             non_attr_kwargs = [k for k in kwargs if k not in self._attr_to_rest_field]
             if non_attr_kwargs:
                 # actual type errors only throw the first wrong keyword arg they see, so following that.
-                raise TypeError(f"{class_name}.__init__() got an unexpected keyword argument '{non_attr_kwargs[0]}'")
+                raise TypeError(
+                    f"{self.__class__.__name__}.__init__() got an unexpected keyword argument '{non_attr_kwargs[0]}'"
+                )
             dict_to_pass.update(
                 {
                     self._attr_to_rest_field[k]._rest_name: _create_value(self._attr_to_rest_field[k], v)
@@ -619,7 +700,7 @@ class Model(_MyMutableMapping):
         super().__init__(dict_to_pass)
 
     def copy(self) -> "Model":
-        return Model(self.__dict__)
+        return Model(dict(self._data))
 
     def __new__(cls, *args: typing.Any, **kwargs: typing.Any) -> Self:
         if f"{cls.__module__}.{cls.__qualname__}" not in cls._calculated:
@@ -641,7 +722,27 @@ class Model(_MyMutableMapping):
                     rf._type = rf._get_deserialize_callable_from_annotation(annotations.get(attr, None))
                 if not rf._rest_name_input:
                     rf._rest_name_input = attr
+                # flatten inherited field descriptors onto the concrete class so
+                # attribute access resolves in one class-dict probe instead of
+                # walking several mro levels (Resource -> TrackedResource -> leaf).
+                # discriminators are skipped since _get_discriminator relies on
+                # them living only on the class that declares them.
+                if attr not in cls.__dict__ and not rf._is_discriminator:
+                    setattr(cls, attr, rf)
             cls._attr_to_rest_field: typing.Dict[str, _RestField] = dict(attr_to_rest_field.items())
+            # wire-name keyed view of the same fields so JSON-keyed lookups are a
+            # single dict probe instead of a linear scan over the field table
+            cls._rest_name_to_field: typing.Dict[str, _RestField] = {
+                rf._rest_name: rf for rf in attr_to_rest_field.values()
+            }
+            # pre-bound readonly wire names, so serialization paths don't rebuild
+            # the filter list on every call
+            cls._readonly_rest_names: typing.FrozenSet[str] = frozenset(
+                rf._rest_name for rf in attr_to_rest_field.values() if _is_readonly(rf)
+            )
+            cls._class_defaults: typing.Dict[str, typing.Any] = {
+                rf._rest_name: rf._default for rf in attr_to_rest_field.values() if rf._default is not _UNSET
+            }
             cls._calculated.add(f"{cls.__module__}.{cls.__qualname__}")
 
         return super().__new__(cls)  # pylint: disable=no-value-for-parameter
@@ -649,7 +750,9 @@ class Model(_MyMutableMapping):
     def __init_subclass__(cls, discriminator: typing.Optional[str] = None) -> None:
         for base in cls.__bases__:
             if hasattr(base, "__mapping__"):
-                base.__mapping__[discriminator or cls.__name__] = cls  # type: ignore
+                # intern the key so lookups against freshly-decoded JSON strings can
+                # short-circuit on pointer equality before falling back to a compare
+                base.__mapping__[sys.intern(discriminator or cls.__name__)] = cls  # type: ignore
 
     @classmethod
     def _get_discriminator(cls, exist_discriminators) -> typing.Optional["_RestField"]:
@@ -680,6 +783,8 @@ class Model(_MyMutableMapping):
                 discriminator_value = data.find(xml_name).text  # pyright: ignore
         else:
             discriminator_value = data.get(discriminator._rest_name)
+        if type(discriminator_value) is str:
+            discriminator_value = sys.intern(discriminator_value)
         mapped_cls = cls.__mapping__.get(discriminator_value, cls)  # pyright: ignore
         return mapped_cls._deserialize(data, exist_discriminators)
 
@@ -692,19 +797,14 @@ class Model(_MyMutableMapping):
         """
 
         result = {}
-        readonly_props = []
+        readonly_props: typing.Collection[str] = ()
         if exclude_readonly:
-            readonly_props = [p._rest_name for p in self._attr_to_rest_field.values() if _is_readonly(p)]
+            readonly_props = self._readonly_rest_names
         for k, v in self.items():
             if exclude_readonly and k in readonly_props:  # pyright: ignore
                 continue
-            is_multipart_file_input = False
-            try:
-                is_multipart_file_input = next(
-                    rf for rf in self._attr_to_rest_field.values() if rf._rest_name == k
-                )._is_multipart_file_input
-            except StopIteration:
-                pass
+            rf = self._rest_name_to_field.get(k)
+            is_multipart_file_input = rf is not None and rf._is_multipart_file_input
             result[k] = v if is_multipart_file_input else Model._as_dict_value(v, exclude_readonly=exclude_readonly)
         return result
 
@@ -892,6 +992,11 @@ def _get_deserialize_callable_from_annotation(  # pylint: disable=too-many-retur
     return functools.partial(_deserialize_default, annotation)
 
 
+@functools.lru_cache(maxsize=None)
+def _enum_value_map(enum_cls: CaseInsensitiveEnumMeta) -> typing.Dict[typing.Any, enum.Enum]:
+    return {m.value: m for m in enum_cls}  # type: ignore
+
+
 def _deserialize_with_callable(
     deserializer: typing.Optional[typing.Callable[[typing.Any], typing.Any]],
     value: typing.Any,
@@ -913,6 +1018,12 @@ def _deserialize_with_callable(
         if deserializer in [int, float, bool]:
             return deserializer(value)
         if isinstance(deserializer, CaseInsensitiveEnumMeta):
+            try:
+                # exact-value hit returns the shared member directly, deduping the
+                # freshly-decoded string and skipping the enum __call__ protocol
+                return _enum_value_map(deserializer)[value]
+            except (KeyError, TypeError):
+                pass
             try:
                 return deserializer(value)
             except ValueError:
@@ -933,7 +1044,18 @@ def _deserialize(
     format: typing.Optional[str] = None,
 ) -> typing.Any:
     if isinstance(value, PipelineResponse):
-        value = value.http_response.json()
+        if orjson is not None:
+            # decode the raw body with orjson when available; the models are lazy
+            # views over the decoded dict, so this is the whole parse cost
+            try:
+                # azure.core.rest responses expose the already-read bytes as
+                # .content; the legacy transport responses only offer .body()
+                body = value.http_response.content
+            except AttributeError:
+                body = value.http_response.body()
+            value = orjson.loads(body)
+        else:
+            value = value.http_response.json()
     if rf is None and format:
         rf = _RestField(format=format)
     if not isinstance(deserializer, functools.partial):
@@ -977,7 +1099,7 @@ class _RestField:
         name: typing.Optional[str] = None,
         type: typing.Optional[typing.Callable] = None,  # pylint: disable=redefined-builtin
         is_discriminator: bool = False,
-        visibility: typing.Optional[typing.List[str]] = None,
+        visibility: typing.Optional[typing.Sequence[str]] = None,
         default: typing.Any = _UNSET,
         format: typing.Optional[str] = None,
         is_multipart_file_input: bool = False,
@@ -988,6 +1110,7 @@ class _RestField:
         self._module: typing.Optional[str] = None
         self._is_discriminator = is_discriminator
         self._visibility = visibility
+        self._vis_mask = sum(_VISIBILITY_BITS.get(v, 0) for v in visibility) if visibility else 0
         self._is_model = False
         self._default = default
         self._format = format
@@ -1006,8 +1129,10 @@ class _RestField:
 
     def __get__(self, obj: Model, type=None):  # pylint: disable=redefined-builtin
         # by this point, type and rest_name will have a value bc we default
-        # them in __new__ of the Model class
-        item = obj.get(self._rest_name)
+        # them in __new__ of the Model class. go straight to the backing dict:
+        # routing through the MutableMapping protocol costs two extra frames
+        # per attribute read
+        item = obj._data.get(self._rest_name)
         if item is None:
             return item
         if self._is_model:
@@ -1017,17 +1142,14 @@ class _RestField:
     def __set__(self, obj: Model, value) -> None:
         if value is None:
             # we want to wipe out entries if users set attr to None
-            try:
-                obj.__delitem__(self._rest_name)
-            except KeyError:
-                pass
+            obj._data.pop(self._rest_name, None)
             return
         if self._is_model:
             if not _is_model(value):
                 value = _deserialize(self._type, value)
-            obj.__setitem__(self._rest_name, value)
+            obj._data[self._rest_name] = value
             return
-        obj.__setitem__(self._rest_name, _serialize(value, self._format))
+        obj._data[self._rest_name] = _serialize(value, self._format)
 
     def _get_deserialize_callable_from_annotation(
         self, annotation: typing.Any
@@ -1039,7 +1161,7 @@ def rest_field(
     *,
     name: typing.Optional[str] = None,
     type: typing.Optional[typing.Callable] = None,  # pylint: disable=redefined-builtin
-    visibility: typing.Optional[typing.List[str]] = None,
+    visibility: typing.Optional[typing.Sequence[str]] = None,
     default: typing.Any = _UNSET,
     format: typing.Optional[str] = None,
     is_multipart_file_input: bool = False,
@@ -1060,7 +1182,7 @@ def rest_discriminator(
     *,
     name: typing.Optional[str] = None,
     type: typing.Optional[typing.Callable] = None,  # pylint: disable=redefined-builtin
-    visibility: typing.Optional[typing.List[str]] = None,
+    visibility: typing.Optional[typing.Sequence[str]] = None,
     xml: typing.Optional[typing.Dict[str, typing.Any]] = None,
 ) -> typing.Any:
     return _RestField(name=name, type=type, is_discriminator=True, visibility=visibility, xml=xml)
@@ -1094,16 +1216,16 @@ def _get_element(
                 model_meta.get("ns"),
             )
 
-        readonly_props = []
+        readonly_props: typing.Collection[str] = ()
         if exclude_readonly:
-            readonly_props = [p._rest_name for p in o._attr_to_rest_field.values() if _is_readonly(p)]
+            readonly_props = o._readonly_rest_names
 
         for k, v in o.items():
             # do not serialize readonly properties
             if exclude_readonly and k in readonly_props:
                 continue
 
-            prop_rest_field = _get_rest_field(o._attr_to_rest_field, k)
+            prop_rest_field = _get_rest_field(o, k)
             if prop_rest_field:
                 prop_meta = getattr(prop_rest_field, "_xml").copy()
                 # use the wire name as xml name if no specific name is set
@@ -18,6 +18,18 @@ from ._enums import SourceType
 if TYPE_CHECKING:
     from .. import models as _models
 
+# Visibility tuples are shared across all rest_field declarations instead of being
+# re-allocated per field, which trims import-time heap churn and GC-tracked objects.
+_VIS_READ = ("read",)
+_VIS_READ_CREATE = ("read", "create")
+_VIS_ALL = ("read", "create", "update", "delete", "query")
+
+# Shared annotation objects: building Optional/Union once and referencing it per
+# field keeps typing.__getitem__ out of the module-import path for repeats.
+_OptStr = Optional[str]
+_OptDateTime = Optional[datetime.datetime]
+_OptCreatedByType = Optional[Union[str, "_models.CreatedByType"]]
+
 
 class DateTimeFilter(_model_base.Model):
     """UTC DateTime filter for dependency map visualization apis.
@@ -27,33 +39,35 @@ class DateTimeFilter(_model_base.Model):
     :ivar end_date_time_utc: End date time for dependency map visualization query.
     :vartype end_date_time_utc: ~datetime.datetime
     """
+    __slots__ = ()
 
     start_date_time_utc: Optional[datetime.datetime] = rest_field(
-        name="startDateTimeUtc", visibility=["read", "create", "update", "delete", "query"], format="rfc3339"
+        name="startDateTimeUtc", visibility=_VIS_ALL, format="rfc3339"
     )
     """Start date time for dependency map visualization query."""
     end_date_time_utc: Optional[datetime.datetime] = rest_field(
-        name="endDateTimeUtc", visibility=["read", "create", "update", "delete", "query"], format="rfc3339"
+        name="endDateTimeUtc", visibility=_VIS_ALL, format="rfc3339"
     )
     """End date time for dependency map visualization query."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        start_date_time_utc: Optional[datetime.datetime] = None,
-        end_date_time_utc: Optional[datetime.datetime] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            start_date_time_utc: Optional[datetime.datetime] = None,
+            end_date_time_utc: Optional[datetime.datetime] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class DependencyMapVisualizationFilter(_model_base.Model):
@@ -64,33 +78,35 @@ class DependencyMapVisualizationFilter(_model_base.Model):
     :ivar process_name_filter: Process name filter.
     :vartype process_name_filter: ~azure.mgmt.dependencymap.models.ProcessNameFilter
     """
+    __slots__ = ()
 
     date_time: Optional["_models.DateTimeFilter"] = rest_field(
-        name="dateTime", visibility=["read", "create", "update", "delete", "query"]
+        name="dateTime", visibility=_VIS_ALL
     )
     """DateTime filter."""
     process_name_filter: Optional["_models.ProcessNameFilter"] = rest_field(
-        name="processNameFilter", visibility=["read", "create", "update", "delete", "query"]
+        name="processNameFilter", visibility=_VIS_ALL
     )
     """Process name filter."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        date_time: Optional["_models.DateTimeFilter"] = None,
-        process_name_filter: Optional["_models.ProcessNameFilter"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            date_time: Optional["_models.DateTimeFilter"] = None,
+            process_name_filter: Optional["_models.ProcessNameFilter"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class Resource(_model_base.Model):
@@ -108,16 +124,17 @@ class Resource(_model_base.Model):
      information.
     :vartype system_data: ~azure.mgmt.dependencymap.models.SystemData
     """
+    __slots__ = ()
 
-    id: Optional[str] = rest_field(visibility=["read"])
+    id: Optional[str] = rest_field(visibility=_VIS_READ)
     """Fully qualified resource ID for the resource. Ex -
      /subscriptions/{subscriptionId}/resourceGroups/{resourceGroupName}/providers/{resourceProviderNamespace}/{resourceType}/{resourceName}."""
-    name: Optional[str] = rest_field(visibility=["read"])
+    name: Optional[str] = rest_field(visibility=_VIS_READ)
     """The name of the resource."""
-    type: Optional[str] = rest_field(visibility=["read"])
+    type: Optional[str] = rest_field(visibility=_VIS_READ)
     """The type of the resource. E.g. \"Microsoft.Compute/virtualMachines\" or
      \"Microsoft.Storage/storageAccounts\"."""
-    system_data: Optional["_models.SystemData"] = rest_field(name="systemData", visibility=["read"])
+    system_data: Optional["_models.SystemData"] = rest_field(name="systemData", visibility=_VIS_READ)
     """Azure Resource Manager metadata containing createdBy and modifiedBy information."""
 
 
@@ -141,29 +158,31 @@ class TrackedResource(Resource):
     :ivar location: The geo-location where the resource lives. Required.
     :vartype location: str
     """
+    __slots__ = ()
 
-    tags: Optional[Dict[str, str]] = rest_field(visibility=["read", "create", "update", "delete", "query"])
+    tags: Optional[Dict[str, str]] = rest_field(visibility=_VIS_ALL)
     """Resource tags."""
-    location: str = rest_field(visibility=["read", "create"])
+    location: str = rest_field(visibility=_VIS_READ_CREATE)
     """The geo-location where the resource lives. Required."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        location: str,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            location: str,
+            tags: Optional[Dict[str, str]] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class DiscoverySourceResource(TrackedResource):
@@ -187,30 +206,32 @@ class DiscoverySourceResource(TrackedResource):
     :ivar properties: The resource-specific properties for this resource.
     :vartype properties: ~azure.mgmt.dependencymap.models.DiscoverySourceResourceProperties
     """
+    __slots__ = ()
 
     properties: Optional["_models.DiscoverySourceResourceProperties"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """The resource-specific properties for this resource."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        location: str,
-        tags: Optional[Dict[str, str]] = None,
-        properties: Optional["_models.DiscoverySourceResourceProperties"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            location: str,
+            tags: Optional[Dict[str, str]] = None,
+            properties: Optional["_models.DiscoverySourceResourceProperties"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class DiscoverySourceResourceProperties(_model_base.Model):
@@ -227,35 +248,37 @@ class DiscoverySourceResourceProperties(_model_base.Model):
     :ivar source_id: Source ArmId of Discovery Source resource. Required.
     :vartype source_id: str
     """
+    __slots__ = ()
 
     __mapping__: Dict[str, _model_base.Model] = {}
     provisioning_state: Optional[Union[str, "_models.ProvisioningState"]] = rest_field(
-        name="provisioningState", visibility=["read"]
+        name="provisioningState", visibility=_VIS_READ
     )
     """Provisioning state of Discovery Source resource. Known values are: \"Succeeded\", \"Failed\",
      \"Canceled\", \"Provisioning\", \"Updating\", \"Deleting\", and \"Accepted\"."""
-    source_type: str = rest_discriminator(name="sourceType", visibility=["read", "create"])
+    source_type: str = rest_discriminator(name="sourceType", visibility=_VIS_READ_CREATE)
     """Source type of Discovery Source resource. Required. \"OffAzure\""""
-    source_id: str = rest_field(name="sourceId", visibility=["read", "create"])
+    source_id: str = rest_field(name="sourceId", visibility=_VIS_READ_CREATE)
     """Source ArmId of Discovery Source resource. Required."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        source_type: str,
-        source_id: str,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            source_type: str,
+            source_id: str,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class DiscoverySourceResourceTagsUpdate(_model_base.Model):
@@ -264,26 +287,28 @@ class DiscoverySourceResourceTagsUpdate(_model_base.Model):
     :ivar tags: Resource tags.
     :vartype tags: dict[str, str]
     """
+    __slots__ = ()
 
-    tags: Optional[Dict[str, str]] = rest_field(visibility=["read", "create", "update", "delete", "query"])
+    tags: Optional[Dict[str, str]] = rest_field(visibility=_VIS_ALL)
     """Resource tags."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> None: ...
+    if TYPE_CHECKING:
 
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+        @overload
+        def __init__(
+            self,
+            *,
+            tags: Optional[Dict[str, str]] = None,
+        ) -> None: ...
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class ErrorAdditionalInfo(_model_base.Model):
@@ -294,10 +319,11 @@ class ErrorAdditionalInfo(_model_base.Model):
     :ivar info: The additional info.
     :vartype info: any
     """
+    __slots__ = ()
 
-    type: Optional[str] = rest_field(visibility=["read"])
+    type: Optional[str] = rest_field(visibility=_VIS_READ)
     """The additional info type."""
-    info: Optional[Any] = rest_field(visibility=["read"])
+    info: Optional[Any] = rest_field(visibility=_VIS_READ)
     """The additional info."""
 
 
@@ -315,17 +341,18 @@ class ErrorDetail(_model_base.Model):
     :ivar additional_info: The error additional info.
     :vartype additional_info: list[~azure.mgmt.dependencymap.models.ErrorAdditionalInfo]
     """
+    __slots__ = ()
 
-    code: Optional[str] = rest_field(visibility=["read"])
+    code: Optional[str] = rest_field(visibility=_VIS_READ)
     """The error code."""
-    message: Optional[str] = rest_field(visibility=["read"])
+    message: Optional[str] = rest_field(visibility=_VIS_READ)
     """The error message."""
-    target: Optional[str] = rest_field(visibility=["read"])
+    target: Optional[str] = rest_field(visibility=_VIS_READ)
     """The error target."""
-    details: Optional[List["_models.ErrorDetail"]] = rest_field(visibility=["read"])
+    details: Optional[List["_models.ErrorDetail"]] = rest_field(visibility=_VIS_READ)
     """The error details."""
     additional_info: Optional[List["_models.ErrorAdditionalInfo"]] = rest_field(
-        name="additionalInfo", visibility=["read"]
+        name="additionalInfo", visibility=_VIS_READ
     )
     """The error additional info."""
 
@@ -337,26 +364,28 @@ class ErrorResponse(_model_base.Model):
     :ivar error: The error object.
     :vartype error: ~azure.mgmt.dependencymap.models.ErrorDetail
     """
+    __slots__ = ()
 
-    error: Optional["_models.ErrorDetail"] = rest_field(visibility=["read", "create", "update", "delete", "query"])
+    error: Optional["_models.ErrorDetail"] = rest_field(visibility=_VIS_ALL)
     """The error object."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        error: Optional["_models.ErrorDetail"] = None,
-    ) -> None: ...
+    if TYPE_CHECKING:
 
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+        @overload
+        def __init__(
+            self,
+            *,
+            error: Optional["_models.ErrorDetail"] = None,
+        ) -> None: ...
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class ExportDependenciesRequest(_model_base.Model):
@@ -367,33 +396,35 @@ class ExportDependenciesRequest(_model_base.Model):
     :ivar filters: Filters for ExportDependencies.
     :vartype filters: ~azure.mgmt.dependencymap.models.DependencyMapVisualizationFilter
     """
+    __slots__ = ()
 
     focused_machine_id: str = rest_field(
-        name="focusedMachineId", visibility=["read", "create", "update", "delete", "query"]
+        name="focusedMachineId", visibility=_VIS_ALL
     )
     """Machine arm id. Required."""
     filters: Optional["_models.DependencyMapVisualizationFilter"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Filters for ExportDependencies."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        focused_machine_id: str,
-        filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            focused_machine_id: str,
+            filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class GetConnectionsForProcessOnFocusedMachineRequest(_model_base.Model):  # pylint: disable=name-too-long
@@ -406,38 +437,40 @@ class GetConnectionsForProcessOnFocusedMachineRequest(_model_base.Model):  # pyl
     :ivar filters: Filters for GetProcessNetworkConnections.
     :vartype filters: ~azure.mgmt.dependencymap.models.DependencyMapVisualizationFilter
     """
+    __slots__ = ()
 
     focused_machine_id: str = rest_field(
-        name="focusedMachineId", visibility=["read", "create", "update", "delete", "query"]
+        name="focusedMachineId", visibility=_VIS_ALL
     )
     """Machine arm id. Required."""
     process_id_on_focused_machine: str = rest_field(
-        name="processIdOnFocusedMachine", visibility=["read", "create", "update", "delete", "query"]
+        name="processIdOnFocusedMachine", visibility=_VIS_ALL
     )
     """Process id. Required."""
     filters: Optional["_models.DependencyMapVisualizationFilter"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Filters for GetProcessNetworkConnections."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        focused_machine_id: str,
-        process_id_on_focused_machine: str,
-        filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            focused_machine_id: str,
+            process_id_on_focused_machine: str,
+            filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class GetConnectionsWithConnectedMachineForFocusedMachineRequest(_model_base.Model):  # pylint: disable=name-too-long
@@ -450,38 +483,40 @@ class GetConnectionsWithConnectedMachineForFocusedMachineRequest(_model_base.Mod
     :ivar filters: Filters for GetNetworkConnectionsBetweenMachines.
     :vartype filters: ~azure.mgmt.dependencymap.models.DependencyMapVisualizationFilter
     """
+    __slots__ = ()
 
     focused_machine_id: str = rest_field(
-        name="focusedMachineId", visibility=["read", "create", "update", "delete", "query"]
+        name="focusedMachineId", visibility=_VIS_ALL
     )
     """Source machine arm id. Required."""
     connected_machine_id: str = rest_field(
-        name="connectedMachineId", visibility=["read", "create", "update", "delete", "query"]
+        name="connectedMachineId", visibility=_VIS_ALL
     )
     """Destination machine arm id. Required."""
     filters: Optional["_models.DependencyMapVisualizationFilter"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Filters for GetNetworkConnectionsBetweenMachines."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        focused_machine_id: str,
-        connected_machine_id: str,
-        filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            focused_machine_id: str,
+            connected_machine_id: str,
+            filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class GetDependencyViewForFocusedMachineRequest(_model_base.Model):  # pylint: disable=name-too-long
@@ -492,33 +527,35 @@ class GetDependencyViewForFocusedMachineRequest(_model_base.Model):  # pylint: d
     :ivar filters: Filters for GetSingleMachineDependencyView.
     :vartype filters: ~azure.mgmt.dependencymap.models.DependencyMapVisualizationFilter
     """
+    __slots__ = ()
 
     focused_machine_id: str = rest_field(
-        name="focusedMachineId", visibility=["read", "create", "update", "delete", "query"]
+        name="focusedMachineId", visibility=_VIS_ALL
     )
     """Machine arm id. Required."""
     filters: Optional["_models.DependencyMapVisualizationFilter"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Filters for GetSingleMachineDependencyView."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        focused_machine_id: str,
-        filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            focused_machine_id: str,
+            filters: Optional["_models.DependencyMapVisualizationFilter"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class MapsResource(TrackedResource):
@@ -542,30 +579,32 @@ class MapsResource(TrackedResource):
     :ivar properties: The resource-specific properties for this resource.
     :vartype properties: ~azure.mgmt.dependencymap.models.MapsResourceProperties
     """
+    __slots__ = ()
 
     properties: Optional["_models.MapsResourceProperties"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """The resource-specific properties for this resource."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        location: str,
-        tags: Optional[Dict[str, str]] = None,
-        properties: Optional["_models.MapsResourceProperties"] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            location: str,
+            tags: Optional[Dict[str, str]] = None,
+            properties: Optional["_models.MapsResourceProperties"] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class MapsResourceProperties(_model_base.Model):
@@ -575,9 +614,10 @@ class MapsResourceProperties(_model_base.Model):
      "Failed", "Canceled", "Provisioning", "Updating", "Deleting", and "Accepted".
     :vartype provisioning_state: str or ~azure.mgmt.dependencymap.models.ProvisioningState
     """
+    __slots__ = ()
 
     provisioning_state: Optional[Union[str, "_models.ProvisioningState"]] = rest_field(
-        name="provisioningState", visibility=["read"]
+        name="provisioningState", visibility=_VIS_READ
     )
     """Provisioning state of Maps resource. Known values are: \"Succeeded\", \"Failed\", \"Canceled\",
      \"Provisioning\", \"Updating\", \"Deleting\", and \"Accepted\"."""
@@ -589,26 +629,28 @@ class MapsResourceTagsUpdate(_model_base.Model):
     :ivar tags: Resource tags.
     :vartype tags: dict[str, str]
     """
+    __slots__ = ()
 
-    tags: Optional[Dict[str, str]] = rest_field(visibility=["read", "create", "update", "delete", "query"])
+    tags: Optional[Dict[str, str]] = rest_field(visibility=_VIS_ALL)
     """Resource tags."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        tags: Optional[Dict[str, str]] = None,
-    ) -> None: ...
+    if TYPE_CHECKING:
 
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+        @overload
+        def __init__(
+            self,
+            *,
+            tags: Optional[Dict[str, str]] = None,
+        ) -> None: ...
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class OffAzureDiscoverySourceResourceProperties(
@@ -624,26 +666,33 @@ class OffAzureDiscoverySourceResourceProperties(
     :ivar source_type: OffAzure discovery source type. Required. OffAzure source type
     :vartype source_type: str or ~azure.mgmt.dependencymap.models.OFF_AZURE
     """
+    __slots__ = ()
 
-    source_type: Literal[SourceType.OFF_AZURE] = rest_discriminator(name="sourceType", visibility=["read", "create", "update", "delete", "query"])  # type: ignore
+    source_type: Literal[SourceType.OFF_AZURE] = rest_discriminator(name="sourceType", visibility=_VIS_ALL)  # type: ignore
     """OffAzure discovery source type. Required. OffAzure source type"""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        source_id: str,
-    ) -> None: ...
+    # wire value of the discriminator, resolved once at class-definition time so
+    # construction skips the per-instance enum -> str serialization
+    _OFF_AZURE = SourceType.OFF_AZURE.value
+
+    if TYPE_CHECKING:
 
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+        @overload
+        def __init__(
+            self,
+            *,
+            source_id: str,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, source_type=SourceType.OFF_AZURE, **kwargs)
+        super().__init__(*args, source_type=self._OFF_AZURE, **kwargs)
 
 
 class Operation(_model_base.Model):
@@ -665,42 +714,44 @@ class Operation(_model_base.Model):
      that are for internal only APIs. "Internal"
     :vartype action_type: str or ~azure.mgmt.dependencymap.models.ActionType
     """
+    __slots__ = ()
 
-    name: Optional[str] = rest_field(visibility=["read"])
+    name: Optional[str] = rest_field(visibility=_VIS_READ)
     """The name of the operation, as per Resource-Based Access Control (RBAC). Examples:
      \"Microsoft.Compute/virtualMachines/write\",
      \"Microsoft.Compute/virtualMachines/capture/action\"."""
-    is_data_action: Optional[bool] = rest_field(name="isDataAction", visibility=["read"])
+    is_data_action: Optional[bool] = rest_field(name="isDataAction", visibility=_VIS_READ)
     """Whether the operation applies to data-plane. This is \"true\" for data-plane operations and
      \"false\" for Azure Resource Manager/control-plane operations."""
     display: Optional["_models.OperationDisplay"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Localized display information for this particular operation."""
-    origin: Optional[Union[str, "_models.Origin"]] = rest_field(visibility=["read"])
+    origin: Optional[Union[str, "_models.Origin"]] = rest_field(visibility=_VIS_READ)
     """The intended executor of the operation; as in Resource Based Access Control (RBAC) and audit
      logs UX. Default value is \"user,system\". Known values are: \"user\", \"system\", and
      \"user,system\"."""
-    action_type: Optional[Union[str, "_models.ActionType"]] = rest_field(name="actionType", visibility=["read"])
+    action_type: Optional[Union[str, "_models.ActionType"]] = rest_field(name="actionType", visibility=_VIS_READ)
     """Extensible enum. Indicates the action type. \"Internal\" refers to actions that are for
      internal only APIs. \"Internal\""""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        display: Optional["_models.OperationDisplay"] = None,
-    ) -> None: ...
+    if TYPE_CHECKING:
 
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+        @overload
+        def __init__(
+            self,
+            *,
+            display: Optional["_models.OperationDisplay"] = None,
+        ) -> None: ...
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class OperationDisplay(_model_base.Model):
@@ -719,17 +770,18 @@ class OperationDisplay(_model_base.Model):
      tool tips and detailed views.
     :vartype description: str
     """
+    __slots__ = ()
 
-    provider: Optional[str] = rest_field(visibility=["read"])
+    provider: Optional[str] = rest_field(visibility=_VIS_READ)
     """The localized friendly form of the resource provider name, e.g. \"Microsoft Monitoring
      Insights\" or \"Microsoft Compute\"."""
-    resource: Optional[str] = rest_field(visibility=["read"])
+    resource: Optional[str] = rest_field(visibility=_VIS_READ)
     """The localized friendly name of the resource type related to this operation. E.g. \"Virtual
      Machines\" or \"Job Schedule Collections\"."""
-    operation: Optional[str] = rest_field(visibility=["read"])
+    operation: Optional[str] = rest_field(visibility=_VIS_READ)
     """The concise, localized friendly name for the operation; suitable for dropdowns. E.g. \"Create
      or Update Virtual Machine\", \"Restart Virtual Machine\"."""
-    description: Optional[str] = rest_field(visibility=["read"])
+    description: Optional[str] = rest_field(visibility=_VIS_READ)
     """The short, localized friendly description of the operation; suitable for tool tips and detailed
      views."""
 
@@ -743,33 +795,35 @@ class ProcessNameFilter(_model_base.Model):
     :ivar process_names: List of process names on which the operator should be applied. Required.
     :vartype process_names: list[str]
     """
+    __slots__ = ()
 
     operator: Union[str, "_models.ProcessNameFilterOperator"] = rest_field(
-        visibility=["read", "create", "update", "delete", "query"]
+        visibility=_VIS_ALL
     )
     """Operator for process name filter. Required. Known values are: \"contains\" and \"notContains\"."""
     process_names: List[str] = rest_field(
-        name="processNames", visibility=["read", "create", "update", "delete", "query"]
+        name="processNames", visibility=_VIS_ALL
     )
     """List of process names on which the operator should be applied. Required."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        operator: Union[str, "_models.ProcessNameFilterOperator"],
-        process_names: List[str],
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
+    if TYPE_CHECKING:
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+        @overload
+        def __init__(
+            self,
+            *,
+            operator: Union[str, "_models.ProcessNameFilterOperator"],
+            process_names: List[str],
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 class SystemData(_model_base.Model):
@@ -790,50 +844,52 @@ class SystemData(_model_base.Model):
     :ivar last_modified_at: The timestamp of resource last modification (UTC).
     :vartype last_modified_at: ~datetime.datetime
     """
+    __slots__ = ()
 
-    created_by: Optional[str] = rest_field(name="createdBy", visibility=["read", "create", "update", "delete", "query"])
+    created_by: _OptStr = rest_field(name="createdBy", visibility=_VIS_ALL)
     """The identity that created the resource."""
-    created_by_type: Optional[Union[str, "_models.CreatedByType"]] = rest_field(
-        name="createdByType", visibility=["read", "create", "update", "delete", "query"]
+    created_by_type: _OptCreatedByType = rest_field(
+        name="createdByType", visibility=_VIS_ALL
     )
     """The type of identity that created the resource. Known values are: \"User\", \"Application\",
      \"ManagedIdentity\", and \"Key\"."""
-    created_at: Optional[datetime.datetime] = rest_field(
-        name="createdAt", visibility=["read", "create", "update", "delete", "query"], format="rfc3339"
+    created_at: _OptDateTime = rest_field(
+        name="createdAt", visibility=_VIS_ALL, format="rfc3339"
     )
     """The timestamp of resource creation (UTC)."""
-    last_modified_by: Optional[str] = rest_field(
-        name="lastModifiedBy", visibility=["read", "create", "update", "delete", "query"]
+    last_modified_by: _OptStr = rest_field(
+        name="lastModifiedBy", visibility=_VIS_ALL
     )
     """The identity that last modified the resource."""
-    last_modified_by_type: Optional[Union[str, "_models.CreatedByType"]] = rest_field(
-        name="lastModifiedByType", visibility=["read", "create", "update", "delete", "query"]
+    last_modified_by_type: _OptCreatedByType = rest_field(
+        name="lastModifiedByType", visibility=_VIS_ALL
     )
     """The type of identity that last modified the resource. Known values are: \"User\",
      \"Application\", \"ManagedIdentity\", and \"Key\"."""
-    last_modified_at: Optional[datetime.datetime] = rest_field(
-        name="lastModifiedAt", visibility=["read", "create", "update", "delete", "query"], format="rfc3339"
+    last_modified_at: _OptDateTime = rest_field(
+        name="lastModifiedAt", visibility=_VIS_ALL, format="rfc3339"
     )
     """The timestamp of resource last modification (UTC)."""
 
-    @overload
-    def __init__(
-        self,
-        *,
-        created_by: Optional[str] = None,
-        created_by_type: Optional[Union[str, "_models.CreatedByType"]] = None,
-        created_at: Optional[datetime.datetime] = None,
-        last_modified_by: Optional[str] = None,
-        last_modified_by_type: Optional[Union[str, "_models.CreatedByType"]] = None,
-        last_modified_at: Optional[datetime.datetime] = None,
-    ) -> None: ...
-
-    @overload
-    def __init__(self, mapping: Mapping[str, Any]) -> None:
-        """
-        :param mapping: raw JSON to initialize the model.
-        :type mapping: Mapping[str, Any]
-        """
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+    if TYPE_CHECKING:
+
+        @overload
+        def __init__(
+            self,
+            *,
+            created_by: Optional[str] = None,
+            created_by_type: Optional[Union[str, "_models.CreatedByType"]] = None,
+            created_at: Optional[datetime.datetime] = None,
+            last_modified_by: Optional[str] = None,
+            last_modified_by_type: Optional[Union[str, "_models.CreatedByType"]] = None,
+            last_modified_at: Optional[datetime.datetime] = None,
+        ) -> None: ...
+
+        @overload
+        def __init__(self, mapping: Mapping[str, Any]) -> None:
+            """
+            :param mapping: raw JSON to initialize the model.
+            :type mapping: Mapping[str, Any]
+            """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
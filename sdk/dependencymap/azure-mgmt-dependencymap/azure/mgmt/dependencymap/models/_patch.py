@@ -8,7 +8,43 @@ Follow our quickstart for examples: https://aka.ms/azsdk/python/dpcodegen/python
 """
 from typing import List
 
-__all__: List[str] = []  # Add all objects you want publicly available to users at this package level
+from . import _models
+from ._enums import ProcessNameFilterOperator
+
+__all__: List[str] = [
+    "ProcessNameFilter"
+]  # Add all objects you want publicly available to users at this package level
+
+
+class ProcessNameFilter(_models.ProcessNameFilter):
+    """Process name filter for dependency map visualization apis.
+
+    Extends the generated model with a client-side membership test backed by a
+    cached frozenset, so repeated checks are a hash lookup instead of a linear
+    scan over ``process_names``.
+
+    :ivar operator: Operator for process name filter. Required. Known values are: "contains" and
+     "notContains".
+    :vartype operator: str or ~azure.mgmt.dependencymap.models.ProcessNameFilterOperator
+    :ivar process_names: List of process names on which the operator should be applied. Required.
+    :vartype process_names: list[str]
+    """
+
+    def matches(self, name: str) -> bool:
+        """Whether a process name passes this filter.
+
+        :param str name: The process name to test.
+        :returns: True if the name satisfies the filter's operator, False otherwise.
+        :rtype: bool
+        """
+        names = self._data.get("processNames") or ()
+        # the stored list is replaced (not mutated) whenever process_names is
+        # reassigned, so identity of the backing list is a valid cache key
+        if self.__dict__.get("_process_names_src") is not names:
+            self.__dict__["_process_names_set"] = frozenset(names)
+            self.__dict__["_process_names_src"] = names
+        contained = name in self.__dict__["_process_names_set"]
+        return contained ^ (self.operator == ProcessNameFilterOperator.NOT_CONTAINS)
 
 
 def patch_sdk():
@@ -7,7 +7,6 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 from io import IOBase
-import json
 import sys
 from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, TypeVar, Union, cast, overload
 import urllib.parse
@@ -34,7 +33,7 @@ from azure.mgmt.core.polling.arm_polling import ARMPolling
 
 from .. import models as _models
 from .._configuration import DependencyMapMgmtClientConfiguration
-from .._model_base import SdkJSONEncoder, _deserialize, _failsafe_deserialize
+from .._model_base import _deserialize, _dump_json, _failsafe_deserialize
 from .._serialization import Deserializer, Serializer
 
 if sys.version_info >= (3, 9):
@@ -719,7 +718,7 @@ class MapsOperations:
         if isinstance(resource, (IOBase, bytes)):
             _content = resource
         else:
-            _content = json.dumps(resource, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(resource, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_create_or_update_request(
             resource_group_name=resource_group_name,
@@ -951,7 +950,7 @@ class MapsOperations:
         if isinstance(properties, (IOBase, bytes)):
             _content = properties
         else:
-            _content = json.dumps(properties, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(properties, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_update_request(
             resource_group_name=resource_group_name,
@@ -1465,7 +1464,7 @@ class MapsOperations:
         if isinstance(body, (IOBase, bytes)):
             _content = body
         else:
-            _content = json.dumps(body, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(body, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_get_dependency_view_for_focused_machine_request(
             resource_group_name=resource_group_name,
@@ -1686,7 +1685,7 @@ class MapsOperations:
         if isinstance(body, (IOBase, bytes)):
             _content = body
         else:
-            _content = json.dumps(body, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(body, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_get_connections_with_connected_machine_for_focused_machine_request(
             resource_group_name=resource_group_name,
@@ -1909,7 +1908,7 @@ class MapsOperations:
         if isinstance(body, (IOBase, bytes)):
             _content = body
         else:
-            _content = json.dumps(body, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(body, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_get_connections_for_process_on_focused_machine_request(
             resource_group_name=resource_group_name,
@@ -2130,7 +2129,7 @@ class MapsOperations:
         if isinstance(body, (IOBase, bytes)):
             _content = body
         else:
-            _content = json.dumps(body, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(body, exclude_readonly=True)  # type: ignore
 
         _request = build_maps_export_dependencies_request(
             resource_group_name=resource_group_name,
@@ -2440,7 +2439,7 @@ class DiscoverySourcesOperations:
         if isinstance(resource, (IOBase, bytes)):
             _content = resource
         else:
-            _content = json.dumps(resource, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(resource, exclude_readonly=True)  # type: ignore
 
         _request = build_discovery_sources_create_or_update_request(
             resource_group_name=resource_group_name,
@@ -2687,7 +2686,7 @@ class DiscoverySourcesOperations:
         if isinstance(properties, (IOBase, bytes)):
             _content = properties
         else:
-            _content = json.dumps(properties, cls=SdkJSONEncoder, exclude_readonly=True)  # type: ignore
+            _content = _dump_json(properties, exclude_readonly=True)  # type: ignore
 
         _request = build_discovery_sources_update_request(
             resource_group_name=resource_group_name,
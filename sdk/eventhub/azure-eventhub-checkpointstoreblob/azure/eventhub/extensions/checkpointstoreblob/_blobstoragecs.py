@@ -4,7 +4,9 @@
 # --------------------------------------------------------------------------------------------
 from typing import Dict, Optional, Any, Iterable, Union, TYPE_CHECKING
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import calendar
 import copy
 from datetime import datetime
@@ -21,6 +23,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 UPLOAD_DATA = ""
+# upper bound on threads used to fan out per-partition ownership claims
+_MAX_CLAIM_WORKERS = 32
 
 
 def _utc_to_local(utc_dt):
@@ -92,6 +96,8 @@ class BlobCheckpointStore(CheckpointStore):
                 **kwargs
             )
         self._cached_blob_clients = defaultdict()  # type: Dict[str, BlobClient]
+        self._claim_executor = None  # type: Optional[ThreadPoolExecutor]
+        self._claim_executor_lock = threading.Lock()
 
     @classmethod
     def from_connection_string(
@@ -282,10 +288,34 @@ class BlobCheckpointStore(CheckpointStore):
                   on storage implementation.
         :rtype: iterable[dict[str, any]]
         """
+        ownerships = list(ownership_list)
+        if len(ownerships) <= 1:
+            gathered_results = []
+            for x in ownerships:
+                try:
+                    gathered_results.append(self._claim_one_partition(x, **kwargs))
+                except OwnershipLostError:
+                    pass
+            return gathered_results
+
+        # fan the per-partition blob uploads out to a shared thread pool so a
+        # claim cycle costs the slowest upload instead of the sum of all of
+        # them; results keep the input order and lost ownerships are dropped
+        # exactly as in the sequential path
+        executor = self._claim_executor
+        if executor is None:
+            with self._claim_executor_lock:
+                executor = self._claim_executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=_MAX_CLAIM_WORKERS, thread_name_prefix="eventhub-claim-ownership"
+                    )
+                    self._claim_executor = executor
+        futures = [executor.submit(self._claim_one_partition, x, **kwargs) for x in ownerships]
         gathered_results = []
-        for x in ownership_list:
+        for future in futures:
             try:
-                gathered_results.append(self._claim_one_partition(x, **kwargs))
+                gathered_results.append(future.result())
             except OwnershipLostError:
                 pass
         return gathered_results
@@ -369,4 +399,8 @@ class BlobCheckpointStore(CheckpointStore):
         return result
 
     def close(self) -> None:
+        with self._claim_executor_lock:
+            if self._claim_executor is not None:
+                self._claim_executor.shutdown(wait=False)
+                self._claim_executor = None
         self._container_client.__exit__()
@@ -325,7 +325,8 @@ class ClientBase:  # pylint:disable=too-many-instance-attributes
         self._idle_timeout = kwargs.get("idle_timeout", None)
 
     @staticmethod
-    def _from_connection_string(conn_str: str, **kwargs: Any) -> Dict[str, Any]:
+    def _populate_connection_string_kwargs(conn_str: str, kwargs: Dict[str, Any]) -> None:
+        """Resolve a connection string into constructor kwargs, mutating ``kwargs`` in place."""
         host, policy, key, entity, token, token_expiry, emulator = _parse_conn_str(conn_str, **kwargs)
 
         kwargs["fully_qualified_namespace"] = host
@@ -337,6 +338,10 @@ class ClientBase:  # pylint:disable=too-many-instance-attributes
             kwargs["credential"] = EventHubSASTokenCredential(token, token_expiry)
         elif policy and key:
             kwargs["credential"] = EventHubSharedKeyCredential(policy, key)
+
+    @staticmethod
+    def _from_connection_string(conn_str: str, **kwargs: Any) -> Dict[str, Any]:
+        ClientBase._populate_connection_string_kwargs(conn_str, kwargs)
         return kwargs
 
     def _create_auth(self, *, auth_uri: Optional[str] = None) -> Union["uamqp_JWTTokenAuth", JWTTokenAuth]:
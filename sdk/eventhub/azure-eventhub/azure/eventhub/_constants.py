@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
+import sys
 from enum import Enum
 
 
@@ -35,7 +36,7 @@ GEOREPLICATION_SYMBOL = b"com.microsoft:georeplication"
 
 MAX_MESSAGE_LENGTH_BYTES = 1024 * 1024
 MAX_USER_AGENT_LENGTH = 512
-ALL_PARTITIONS = "all-partitions"
+ALL_PARTITIONS = sys.intern("all-partitions")  # hyphen defeats automatic literal interning
 CONTAINER_PREFIX = "eventhub.pysdk-"
 JWT_TOKEN_SCOPE = "https://eventhubs.azure.net//.default"
 MGMT_OPERATION = b"com.microsoft:eventhub"
@@ -2,21 +2,30 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import functools
 import logging
+import sys
 import threading
+import weakref
 import datetime
 import warnings
-from typing import TYPE_CHECKING, List, Literal, Union, Any, Callable, Optional, Dict, Tuple, overload
+from typing import TYPE_CHECKING, Any
 
 from ._client_base import ClientBase
 from ._consumer import EventHubConsumer
 from ._constants import ALL_PARTITIONS, TransportType
-from ._eventprocessor.event_processor import EventProcessor
 from ._eventprocessor.common import LoadBalancingStrategy
 
 
 if TYPE_CHECKING:
+    # with postponed evaluation of annotations these are never needed at
+    # runtime, so keep the typing imports off the module-load path
+    from typing import Callable, Dict, List, Literal, Optional, Union, overload
+
     from ssl import SSLContext
+    from ._eventprocessor.event_processor import EventProcessor
     from ._eventprocessor.partition_context import PartitionContext
     from ._common import EventData
     from ._client_base import CredentialTypes
@@ -25,6 +34,22 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+class _PendingProcessor:
+    """Reserves a (consumer group, partition) slot in ``_event_processors`` while
+    the real EventProcessor is constructed outside the client lock. A plain
+    ``object()`` would do, but the registries hold their values weakly and bare
+    objects cannot be weak-referenced.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+_PENDING = _PendingProcessor()
+
+# emit the uamqp_transport deprecation warning at most once per process so
+# client-per-partition workloads don't pay for warning-frame setup repeatedly
+_UAMQP_WARNED = False
+
 
 class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-version-keyword
 
@@ -109,6 +134,10 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
      load-balancing evaluation, will grab as many unclaimed partitions required to balance the load.
      Use "balanced" or `LoadBalancingStrategy.BALANCED` for the balanced strategy, which, for every load-balancing
      evaluation, claims only one partition that is not claimed by other `EventHubConsumerClient`.
+     Use "sticky" or `LoadBalancingStrategy.STICKY` for the sticky strategy, which keeps the partitions a client
+     already owns and claims only unclaimed or expired partitions up to a deterministic fair share, minimizing the
+     partition movement (and the AMQP link rebuilds and prefetch refills that come with it) when clients join or
+     leave.
      If all partitions of an EventHub are claimed by other `EventHubConsumerClient` and this client has claimed
      too few partitions, this client will steal one partition from other clients for every load-balancing
      evaluation regardless of the load balancing strategy.
@@ -147,6 +176,24 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
             :caption: Create a new instance of the EventHubConsumerClient.
     """
 
+    # ClientBase does not declare __slots__, so instances keep a __dict__ for
+    # inherited state; slotting the attributes set here still speeds up their
+    # lookups in the hot _receive/_create_consumer paths
+    __slots__ = (
+        "_checkpoint_store",
+        "_load_balancing_interval",
+        "_partition_ownership_expiration_interval",
+        "_load_balancing_strategy",
+        "_consumer_group",
+        "_auth_uri_cached",
+        "_source_url_prefix",
+        "_prefetch_default",
+        "_consumer_factory",
+        "_lock",
+        "_event_processors",
+        "_processor_base_kwargs",
+    )
+
     def __init__(
         self,
         fully_qualified_namespace: str,
@@ -156,7 +203,9 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         **kwargs: Any,
     ) -> None:
         # Deprecation of uamqp transport
-        if kwargs.get("uamqp_transport"):
+        global _UAMQP_WARNED  # pylint:disable=global-statement
+        if kwargs.get("uamqp_transport") and not _UAMQP_WARNED:
+            _UAMQP_WARNED = True
             warnings.warn(
                 "uAMQP legacy support will be removed in the 5.16.0 minor release. "
                 "Please remove the use of `uamqp_transport` keyword argument from the client in order "
@@ -166,29 +215,66 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
                 DeprecationWarning, stacklevel=2
             )
         self._checkpoint_store = kwargs.pop("checkpoint_store", None)
-        self._load_balancing_interval = kwargs.pop("load_balancing_interval", None)
-        if self._load_balancing_interval is None:
-            self._load_balancing_interval = 30
-        self._partition_ownership_expiration_interval = kwargs.pop("partition_ownership_expiration_interval", None)
-        if self._partition_ownership_expiration_interval is None:
-            self._partition_ownership_expiration_interval = 6 * self._load_balancing_interval
-        load_balancing_strategy = kwargs.pop("load_balancing_strategy", None)
-        self._load_balancing_strategy = (
-            LoadBalancingStrategy(load_balancing_strategy) if load_balancing_strategy else LoadBalancingStrategy.GREEDY
+        self._load_balancing_interval = kwargs.pop("load_balancing_interval", None) or 30
+        self._partition_ownership_expiration_interval = (
+            kwargs.pop("partition_ownership_expiration_interval", None) or 6 * self._load_balancing_interval
+        )
+        self._load_balancing_strategy = LoadBalancingStrategy(
+            kwargs.pop("load_balancing_strategy", None) or LoadBalancingStrategy.GREEDY
         )
-        self._consumer_group = consumer_group
+        # interned: the group name keys long-lived dicts (ownership, processor
+        # registry) and interning makes those lookups pointer comparisons
+        self._consumer_group = sys.intern(consumer_group)
         network_tracing = kwargs.pop("logging_enable", False)
-        super(EventHubConsumerClient, self).__init__(
+        super().__init__(
             fully_qualified_namespace=fully_qualified_namespace,
             eventhub_name=eventhub_name,
             credential=credential,
             network_tracing=network_tracing,
             **kwargs,
         )
-        # consumer auth URI additionally includes consumer group
-        self._auth_uri = f"sb://{self._address.hostname}{self._address.path}/consumergroups/{self._consumer_group}"
+        # consumer auth URI is built on first use; metadata-only clients
+        # authenticate against the event hub URI and never need it
+        self._auth_uri_cached: Optional[str] = None
+        # source URLs only differ by consumer group/partition, so share the prefix
+        # across the per-partition consumers recreated on rebalance
+        self._source_url_prefix = f"amqps://{self._address.hostname}{self._address.path}/ConsumerGroups/"
+        # the configured prefetch never changes after construction; cache it so
+        # consumer re-creation skips the _config attribute chain
+        self._prefetch_default = self._config.prefetch
+        # idle timeout and transport are fixed per client, so bind them once
+        # instead of repacking them on every consumer re-creation
+        self._consumer_factory = functools.partial(
+            EventHubConsumer,
+            self,
+            idle_timeout=self._idle_timeout,
+            amqp_transport=self._amqp_transport,
+        )
         self._lock = threading.Lock()
-        self._event_processors: Dict[Tuple[str, str], EventProcessor] = {}
+        # sharded by consumer group so every conflict check in _receive is a
+        # pair of hash lookups; an empty inner dict means no active processors.
+        # Values are held weakly: the dispatching _receive call owns the only
+        # strong reference, so a processor (and its prefetch buffers) becomes
+        # collectable the moment its receive loop unwinds
+        self._event_processors: Dict[str, "weakref.WeakValueDictionary[str, EventProcessor]"] = {}
+        # EventProcessor arguments that come straight from client state and
+        # never vary between _receive calls
+        self._processor_base_kwargs: Dict[str, Any] = {
+            "consumer_group": self._consumer_group,
+            "checkpoint_store": self._checkpoint_store,
+            "load_balancing_interval": self._load_balancing_interval,
+            "load_balancing_strategy": self._load_balancing_strategy,
+            "partition_ownership_expiration_interval": self._partition_ownership_expiration_interval,
+        }
+
+    @property
+    def _auth_uri(self) -> str:
+        # consumer auth URI additionally includes consumer group
+        uri = self._auth_uri_cached
+        if uri is None:
+            uri = f"sb://{self._address.hostname}{self._address.path}/consumergroups/{self._consumer_group}"
+            self._auth_uri_cached = uri
+        return uri
 
     def __enter__(self) -> "EventHubConsumerClient":
         return self
@@ -204,25 +290,21 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         on_event_received: Callable[["PartitionContext", "EventData"], None],
         **kwargs: Any,
     ) -> EventHubConsumer:
+        partition_id = sys.intern(partition_id)
         owner_level = kwargs.get("owner_level")
-        prefetch = kwargs.get("prefetch") or self._config.prefetch
+        prefetch = kwargs.get("prefetch") or self._prefetch_default
         track_last_enqueued_event_properties = kwargs.get("track_last_enqueued_event_properties", False)
         event_position_inclusive = kwargs.get("event_position_inclusive", False)
 
-        source_url = "amqps://{}{}/ConsumerGroups/{}/Partitions/{}".format(
-            self._address.hostname, self._address.path, consumer_group, partition_id
-        )
-        handler = EventHubConsumer(
-            self,
+        source_url = f"{self._source_url_prefix}{consumer_group}/Partitions/{partition_id}"
+        handler = self._consumer_factory(
             source_url,
             event_position=event_position,
             event_position_inclusive=event_position_inclusive,
             owner_level=owner_level,
             on_event_received=on_event_received,
             prefetch=prefetch,
-            idle_timeout=self._idle_timeout,
             track_last_enqueued_event_properties=track_last_enqueued_event_properties,
-            amqp_transport=self._amqp_transport,
         )
         return handler
 
@@ -346,8 +428,11 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
                 :caption: Create a new instance of the EventHubConsumerClient from connection string.
 
         """
-        constructor_args = cls._from_connection_string(
-            conn_str,
+        # build the constructor kwargs once and resolve the connection string
+        # into them in place, instead of packing them a second time through
+        # _from_connection_string
+        constructor_args = dict(
+            kwargs,
             consumer_group=consumer_group,
             eventhub_name=eventhub_name,
             logging_enable=logging_enable,
@@ -368,17 +453,31 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
             connection_verify=connection_verify,
             ssl_context=ssl_context,
             uamqp_transport=uamqp_transport,
-            **kwargs,
         )
+        cls._populate_connection_string_kwargs(conn_str, constructor_args)
         return cls(**constructor_args)
 
-    @overload
-    def _receive(
-        self, on_event: Callable[["PartitionContext", Optional["EventData"]], None], **kwargs: Any
-    ) -> None: ...
+    def _discard_event_processor(self, partition_key: str) -> None:
+        # lock-free: both dict operations here are atomic under the GIL; the
+        # empty inner dict is left in place since a client only ever registers
+        # processors for its own consumer group
+        by_cg = self._event_processors.get(self._consumer_group)
+        if by_cg is not None:
+            by_cg.pop(partition_key, None)
 
-    @overload
-    def _receive(self, on_event: Callable[["PartitionContext", List["EventData"]], None], **kwargs: Any) -> None: ...
+    if TYPE_CHECKING:
+        # type checkers read these statically; keeping them out of the runtime
+        # class body avoids creating two throwaway function objects per import
+
+        @overload
+        def _receive(
+            self, on_event: Callable[["PartitionContext", Optional["EventData"]], None], **kwargs: Any
+        ) -> None: ...
+
+        @overload
+        def _receive(
+            self, on_event: Callable[["PartitionContext", List["EventData"]], None], **kwargs: Any
+        ) -> None: ...
 
     def _receive(  # pylint:disable=unused-argument
         self,
@@ -401,39 +500,66 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         on_partition_close: Optional[Callable[["PartitionContext", "CloseReason"], None]] = None,
         **kwargs: Any,
     ) -> None:
+        # deferred so metadata-only clients never pay for the event-processor
+        # subsystem (load balancer, checkpoint interfaces, partition contexts)
+        from ._eventprocessor.event_processor import EventProcessor
+
+        key = partition_id or ALL_PARTITIONS
+        # per-call load-balancing overrides; the shared base kwargs are copied
+        # only when a caller actually overrides something
+        processor_kwargs = self._processor_base_kwargs
+        quantize_rebalancing = kwargs.pop("quantize_rebalancing", True)
+        checkpoint_flush_interval = kwargs.pop("checkpoint_flush_interval", None)
+        load_balancing_strategy = kwargs.pop("load_balancing_strategy", None)
+        load_balancing_interval = kwargs.pop("load_balancing_interval", None)
+        partition_ownership_expiration_interval = kwargs.pop("partition_ownership_expiration_interval", None)
+        if load_balancing_strategy or load_balancing_interval or partition_ownership_expiration_interval:
+            processor_kwargs = dict(processor_kwargs)
+            if load_balancing_strategy:
+                processor_kwargs["load_balancing_strategy"] = LoadBalancingStrategy(load_balancing_strategy)
+            if load_balancing_interval:
+                processor_kwargs["load_balancing_interval"] = load_balancing_interval
+                if not partition_ownership_expiration_interval:
+                    processor_kwargs["partition_ownership_expiration_interval"] = 6 * load_balancing_interval
+            if partition_ownership_expiration_interval:
+                processor_kwargs["partition_ownership_expiration_interval"] = partition_ownership_expiration_interval
+        # only the conflict check plus slot reservation need the lock; building
+        # the EventProcessor itself is comparatively heavy and runs unlocked
         with self._lock:
-            error: Optional[str] = None
-            if (self._consumer_group, ALL_PARTITIONS) in self._event_processors:
+            by_cg = self._event_processors.setdefault(self._consumer_group, weakref.WeakValueDictionary())
+            # error strings are only built on the conflict paths; the common
+            # no-conflict case does no formatting at all
+            if ALL_PARTITIONS in by_cg:
                 error = (
                     "This consumer client is already receiving events "
-                    "from all partitions for consumer group {}.".format(self._consumer_group)
-                )
-            elif partition_id is None and any(x[0] == self._consumer_group for x in self._event_processors):
-                error = "This consumer client is already receiving events " "for consumer group {}.".format(
-                    self._consumer_group
+                    f"from all partitions for consumer group {self._consumer_group}."
                 )
-            elif (self._consumer_group, partition_id) in self._event_processors:
+                _LOGGER.warning(error)
+                raise ValueError(error)
+            if partition_id is None and by_cg:
+                error = f"This consumer client is already receiving events for consumer group {self._consumer_group}."
+                _LOGGER.warning(error)
+                raise ValueError(error)
+            if key in by_cg:
                 error = (
                     "This consumer client is already receiving events "
-                    "from partition {} for consumer group {}. ".format(partition_id, self._consumer_group)
+                    f"from partition {partition_id} for consumer group {self._consumer_group}. "
                 )
-            if error:
                 _LOGGER.warning(error)
                 raise ValueError(error)
-
+            by_cg[key] = _PENDING
+        try:
             initial_event_position = starting_position if starting_position is not None else "@latest"
             initial_event_position_inclusive = starting_position_inclusive or False
             event_processor = EventProcessor(
                 self,
-                self._consumer_group,
-                on_event,
+                on_event=on_event,
+                **processor_kwargs,
                 batch=batch,
                 max_batch_size=max_batch_size,
                 partition_id=partition_id,
-                checkpoint_store=self._checkpoint_store,
-                load_balancing_interval=self._load_balancing_interval,
-                load_balancing_strategy=self._load_balancing_strategy,
-                partition_ownership_expiration_interval=self._partition_ownership_expiration_interval,
+                quantize_rebalancing=quantize_rebalancing,
+                checkpoint_flush_interval=checkpoint_flush_interval,
                 initial_event_position=initial_event_position,
                 initial_event_position_inclusive=initial_event_position_inclusive,
                 max_wait_time=max_wait_time,
@@ -444,16 +570,16 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
                 on_partition_initialize=on_partition_initialize,
                 on_partition_close=on_partition_close,
             )
-            self._event_processors[(self._consumer_group, partition_id or ALL_PARTITIONS)] = event_processor
+            # single dict store is atomic under the GIL
+            by_cg[key] = event_processor
+        except Exception:
+            self._discard_event_processor(key)
+            raise
         try:
             event_processor.start()
         finally:
             event_processor.stop()
-            with self._lock:
-                try:
-                    del self._event_processors[(self._consumer_group, partition_id or ALL_PARTITIONS)]
-                except KeyError:
-                    pass
+            self._discard_event_processor(key)
 
     def receive(  # pylint:disable=unused-argument
         self,
@@ -531,6 +657,22 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
          `on_partition_close(partition_context, reason)`.
          Please refer to :class:`CloseReason<azure.eventhub.CloseReason>` for the various closing reasons.
         :paramtype on_partition_close: callable[[~azure.eventhub.PartitionContext, ~azure.eventhub.CloseReason]]
+        :keyword load_balancing_strategy: Overrides the client-level load-balancing strategy for this call.
+         "greedy" claims all partitions needed to balance in each load-balancing cycle, which reaches a
+         balanced state in roughly one cycle on cold start; "balanced" claims one partition per cycle.
+        :paramtype load_balancing_strategy: str or ~azure.eventhub.LoadBalancingStrategy or None
+        :keyword float load_balancing_interval: Overrides the client-level load-balancing cycle interval,
+         in seconds, for this call.
+        :keyword float partition_ownership_expiration_interval: Overrides the client-level partition
+         ownership expiration interval, in seconds, for this call.
+        :keyword bool quantize_rebalancing: Align load-balancing ticks to interval boundaries with a
+         per-processor phase offset, spreading checkpoint-store traffic when many consumers start at
+         once. Default is True; set to False to restore randomly jittered ticks.
+        :keyword float checkpoint_flush_interval: If set, checkpoint updates are coalesced in memory,
+         keeping only the latest checkpoint per partition, and flushed to the checkpoint store on this
+         interval in seconds. This trades checkpoint durability granularity (at most one interval of
+         progress is replayed after an unclean shutdown) for far fewer storage writes. Default is None,
+         meaning every checkpoint update is written through immediately.
         :rtype: None
 
         .. admonition:: Example:
@@ -556,6 +698,7 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
             on_error=on_error,
             on_partition_initialize=on_partition_initialize,
             on_partition_close=on_partition_close,
+            **kwargs,
         )
 
     def receive_batch(
@@ -640,6 +783,22 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
          `on_partition_close(partition_context, reason)`.
          Please refer to :class:`CloseReason<azure.eventhub.CloseReason>` for the various closing reasons.
         :paramtype on_partition_close: callable[[~azure.eventhub.PartitionContext, ~azure.eventhub.CloseReason]]
+        :keyword load_balancing_strategy: Overrides the client-level load-balancing strategy for this call.
+         "greedy" claims all partitions needed to balance in each load-balancing cycle, which reaches a
+         balanced state in roughly one cycle on cold start; "balanced" claims one partition per cycle.
+        :paramtype load_balancing_strategy: str or ~azure.eventhub.LoadBalancingStrategy or None
+        :keyword float load_balancing_interval: Overrides the client-level load-balancing cycle interval,
+         in seconds, for this call.
+        :keyword float partition_ownership_expiration_interval: Overrides the client-level partition
+         ownership expiration interval, in seconds, for this call.
+        :keyword bool quantize_rebalancing: Align load-balancing ticks to interval boundaries with a
+         per-processor phase offset, spreading checkpoint-store traffic when many consumers start at
+         once. Default is True; set to False to restore randomly jittered ticks.
+        :keyword float checkpoint_flush_interval: If set, checkpoint updates are coalesced in memory,
+         keeping only the latest checkpoint per partition, and flushed to the checkpoint store on this
+         interval in seconds. This trades checkpoint durability granularity (at most one interval of
+         progress is replayed after an unclean shutdown) for far fewer storage writes. Default is None,
+         meaning every checkpoint update is written through immediately.
         :rtype: None
 
         .. admonition:: Example:
@@ -681,7 +840,7 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         :rtype: dict[str, any]
         :raises: :class:`EventHubError<azure.eventhub.exceptions.EventHubError>`
         """
-        return super(EventHubConsumerClient, self)._get_eventhub_properties()
+        return super()._get_eventhub_properties()
 
     def get_partition_ids(self) -> List[str]:
         """Get partition IDs of the Event Hub.
@@ -690,7 +849,7 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         :rtype: list[str]
         :raises: :class:`EventHubError<azure.eventhub.exceptions.EventHubError>`
         """
-        return super(EventHubConsumerClient, self)._get_partition_ids()
+        return super()._get_partition_ids()
 
     def get_partition_properties(self, partition_id: str) -> Dict[str, Any]:
         """Get properties of the specified partition.
@@ -711,11 +870,16 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
         :rtype: dict[str, any]
         :raises: :class:`EventHubError<azure.eventhub.exceptions.EventHubError>`
         """
-        return super(EventHubConsumerClient, self)._get_partition_properties(partition_id)
+        return super()._get_partition_properties(partition_id)
 
     def close(self) -> None:
         """Stop retrieving events from the Event Hub and close the underlying AMQP connection and links.
 
+        Processors are stopped outside the client's internal lock, so a concurrent
+        `receive`/`receive_batch` call that starts while `close` is draining links is
+        not blocked and may register a new processor; call `close` after receive
+        loops have been signalled to stop.
+
         :rtype: None
 
         .. admonition:: Example:
@@ -729,7 +893,12 @@ class EventHubConsumerClient(ClientBase):  # pylint: disable=client-accepts-api-
 
         """
         with self._lock:
-            for processor in self._event_processors.values():
-                processor.stop()
+            # detach the registry first so lock-free cleanup in _receive never
+            # mutates a dict we are iterating
+            processors = self._event_processors
             self._event_processors = {}
-        super(EventHubConsumerClient, self)._close()
+        for by_cg in processors.values():
+            for processor in list(by_cg.values()):
+                if processor is not _PENDING:
+                    processor.stop()
+        super()._close()
@@ -0,0 +1,105 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+from __future__ import annotations
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .checkpoint_store import CheckpointStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CheckpointCoalescer(CheckpointStore):
+    """A write-coalescing wrapper around another :class:`CheckpointStore`.
+
+    Only the latest checkpoint per partition is kept in memory and flushed to
+    the wrapped store on a background interval, so callers that checkpoint
+    every event pay one dict store per update instead of a storage round trip.
+    The trade-off is durability granularity: on an unclean shutdown, at most
+    one flush interval of checkpoint progress is replayed.
+
+    :param checkpoint_store: The store that flushed checkpoints are written to.
+    :type checkpoint_store: ~azure.eventhub.CheckpointStore
+    :param float flush_interval: How often, in seconds, pending checkpoints are
+     flushed to the wrapped store.
+    """
+
+    def __init__(self, checkpoint_store: CheckpointStore, flush_interval: float) -> None:
+        self._inner = checkpoint_store
+        self._flush_interval = flush_interval
+        # latest checkpoint per partition; single dict stores are atomic under
+        # the GIL and each receive loop only writes its own partition's key
+        self._pending: Dict[Tuple[str, str, str, str], Dict[str, Optional[Union[str, int]]]] = {}
+        self._flush_lock = threading.Lock()
+        self._stop_flushing = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            with self._flush_lock:
+                if self._flush_thread is None or not self._flush_thread.is_alive():
+                    self._stop_flushing.clear()
+                    thread = threading.Thread(target=self._flush_loop, daemon=True)
+                    thread.start()
+                    self._flush_thread = thread
+
+    def _flush_loop(self) -> None:
+        while not self._stop_flushing.wait(self._flush_interval):
+            self.flush()
+
+    def flush(self, **kwargs: Any) -> None:
+        """Write every pending checkpoint through to the wrapped store.
+
+        :rtype: None
+        """
+        for key in list(self._pending):
+            checkpoint = self._pending.pop(key, None)
+            if checkpoint is None:
+                continue
+            try:
+                self._inner.update_checkpoint(checkpoint, **kwargs)
+            except Exception as error:  # pylint:disable=broad-except
+                # put the checkpoint back unless a newer one arrived meanwhile,
+                # then let the next flush retry it
+                self._pending.setdefault(key, checkpoint)
+                _LOGGER.warning(
+                    "An error occurred flushing the checkpoint of partition %r. The exception is %r.",
+                    key[3],
+                    error,
+                )
+
+    def list_ownership(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str, **kwargs: Any
+    ) -> Iterable[Dict[str, Any]]:
+        return self._inner.list_ownership(fully_qualified_namespace, eventhub_name, consumer_group, **kwargs)
+
+    def claim_ownership(self, ownership_list: Iterable[Dict[str, Any]], **kwargs: Any) -> Iterable[Dict[str, Any]]:
+        return self._inner.claim_ownership(ownership_list, **kwargs)
+
+    def update_checkpoint(self, checkpoint: Dict[str, Optional[Union[str, int]]], **kwargs: Any) -> None:
+        key = (
+            checkpoint["fully_qualified_namespace"],
+            checkpoint["eventhub_name"],
+            checkpoint["consumer_group"],
+            checkpoint["partition_id"],
+        )
+        self._pending[key] = checkpoint  # type: ignore[assignment,index]
+        self._ensure_flush_thread()
+
+    def list_checkpoints(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str, **kwargs: Any
+    ) -> Iterable[Dict[str, Any]]:
+        # flush first so readers observe their own recent writes
+        self.flush()
+        return self._inner.list_checkpoints(fully_qualified_namespace, eventhub_name, consumer_group, **kwargs)
+
+    def close(self) -> None:
+        """Stop the background flusher and write out any pending checkpoints.
+
+        :rtype: None
+        """
+        self._stop_flushing.set()
+        self.flush()
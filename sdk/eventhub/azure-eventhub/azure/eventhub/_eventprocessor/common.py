@@ -20,3 +20,4 @@ class CloseReason(Enum):
 class LoadBalancingStrategy(Enum):
     GREEDY = "greedy"
     BALANCED = "balanced"
+    STICKY = "sticky"
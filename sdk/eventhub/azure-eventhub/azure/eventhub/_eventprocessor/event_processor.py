@@ -5,6 +5,7 @@
 from __future__ import annotations
 import random
 import uuid
+import zlib
 import logging
 import time
 import threading
@@ -29,6 +30,7 @@ from .._tracing import (
     is_tracing_enabled,
 )
 from .partition_context import PartitionContext
+from .checkpoint_coalescer import CheckpointCoalescer
 from .in_memory_checkpoint_store import InMemoryCheckpointStore
 from .ownership_manager import OwnershipManager
 from .common import CloseReason, LoadBalancingStrategy
@@ -44,6 +46,10 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# base backoff, in seconds, applied to partitions that keep polling empty;
+# doubles per consecutive empty poll and is capped at 1000x the base
+_IDLE_PARTITION_BASE_TICK = 0.01
+
 
 class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-attributes
     """
@@ -69,6 +75,7 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
         on_partition_initialize: Optional[Callable[[PartitionContext], None]] = None,
         on_partition_close: Optional[Callable[[PartitionContext, CloseReason], None]] = None,
         checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_flush_interval: Optional[float] = None,
         initial_event_position: Union[int, str, datetime, Mapping[str, Union[int, str, datetime]]] = "@latest",
         initial_event_position_inclusive: Union[bool, Mapping[str, bool]] = False,
         load_balancing_interval: float = 30.0,
@@ -77,6 +84,7 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
         owner_level: Optional[int] = None,
         prefetch: Optional[int] = None,
         track_last_enqueued_event_properties: bool = False,
+        quantize_rebalancing: bool = True,
     ) -> None:
         self._consumer_group = consumer_group
         self._eventhub_client = eventhub_client
@@ -91,6 +99,9 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
         self._partition_initialize_handler: Optional[Callable[[PartitionContext], None]] = on_partition_initialize
         self._partition_close_handler: Optional[Callable[[PartitionContext, CloseReason], None]] = on_partition_close
         self._checkpoint_store = checkpoint_store or InMemoryCheckpointStore()
+        if checkpoint_flush_interval and checkpoint_store:
+            # coalesce per-event checkpoint writes into interval flushes
+            self._checkpoint_store = CheckpointCoalescer(self._checkpoint_store, checkpoint_flush_interval)
         self._initial_event_position: Union[int, str, datetime, Mapping[str, Union[int, str, datetime]]] = (
             initial_event_position
         )
@@ -105,6 +116,12 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
         )
 
         self._partition_contexts: Dict[str, PartitionContext] = {}
+        # per-partition empty-poll feedback: consistently idle partitions are
+        # skipped with geometric backoff so receive attention concentrates on
+        # partitions that actually have data; no lock needed since the receive
+        # loop is the only writer of these keys
+        self._empty_poll_counts: Dict[str, int] = {}
+        self._skip_receive_until: Dict[str, float] = {}
 
         # Receive parameters
         self._owner_level: Optional[int] = owner_level
@@ -113,6 +130,15 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
         self._prefetch: Optional[int] = prefetch
         self._track_last_enqueued_event_properties = track_last_enqueued_event_properties
         self._id = str(uuid.uuid4())
+        self._quantize_rebalancing = quantize_rebalancing
+        # deterministic phase offset inside the load-balancing interval:
+        # processors started by the same scale-out event tick at different
+        # points of the interval instead of hammering the checkpoint store
+        # together (uuid-based so it is stable for this processor's lifetime)
+        self._load_balancing_phase = (
+            zlib.crc32(self._id.encode()) % max(int(self._load_balancing_interval * 1000), 1)
+        ) / 1000.0
+        self._stop_event = threading.Event()
         self._running = False
         self._lock = threading.RLock()
 
@@ -255,8 +281,11 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
 
         """
         while self._running:
-            random_jitter = self._load_balancing_interval * random.random() * 0.2
-            load_balancing_interval = self._load_balancing_interval + random_jitter
+            if self._quantize_rebalancing:
+                load_balancing_interval = self._load_balancing_interval
+            else:
+                random_jitter = self._load_balancing_interval * random.random() * 0.2
+                load_balancing_interval = self._load_balancing_interval + random_jitter
             try:
                 claimed_partition_ids = self._ownership_manager.claim_ownership()
                 if claimed_partition_ids:
@@ -297,10 +326,21 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
                 )
                 self._process_error(None, err)  # type: ignore
 
-            time.sleep(load_balancing_interval)
+            if self._quantize_rebalancing:
+                # align the next tick to the quantized boundary plus this
+                # processor's phase so claim attempts stay spread out
+                now = time.time()
+                next_tick = (now // load_balancing_interval) * load_balancing_interval + self._load_balancing_phase
+                if next_tick <= now:
+                    next_tick += load_balancing_interval
+                self._stop_event.wait(next_tick - now)
+            else:
+                self._stop_event.wait(load_balancing_interval)
 
     def _close_consumer(self, partition_id: str, consumer: EventHubConsumer, reason: CloseReason) -> None:
         consumer.close()
+        self._empty_poll_counts.pop(partition_id, None)
+        self._skip_receive_until.pop(partition_id, None)
         with self._lock:
             del self._consumers[partition_id]
 
@@ -361,17 +401,50 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
 
         _LOGGER.info("EventProcessor %r is being started", self._id)
         self._running = True
+        self._stop_event.clear()
         thread = threading.Thread(target=self._load_balancing)
         thread.daemon = True
         thread.start()
 
         while self._running:
+            now = time.time()
+            polled_any = False
+            earliest_due: Optional[float] = None
             for partition_id, consumer in list(self._consumers.items()):
                 if consumer.stop:
                     self._close_consumer(partition_id, consumer, CloseReason.OWNERSHIP_LOST)
                     continue
 
+                skip_until = self._skip_receive_until.get(partition_id)
+                if skip_until is not None and now < skip_until:
+                    if earliest_due is None or skip_until < earliest_due:
+                        earliest_due = skip_until
+                    continue
+                polled_any = True
+
+                last_event_before = consumer._last_received_event  # pylint:disable=protected-access
                 self._do_receive(partition_id, consumer)
+                if (
+                    consumer._message_buffer  # pylint:disable=protected-access
+                    or consumer._last_received_event is not last_event_before  # pylint:disable=protected-access
+                ):
+                    # the partition produced data; restore full attention
+                    self._empty_poll_counts.pop(partition_id, None)
+                    self._skip_receive_until.pop(partition_id, None)
+                else:
+                    empty_count = self._empty_poll_counts.get(partition_id, 0) + 1
+                    self._empty_poll_counts[partition_id] = empty_count
+                    backoff = min(2**empty_count, 1000) * _IDLE_PARTITION_BASE_TICK
+                    if self._max_wait_time:
+                        # never delay the on-empty callback past its deadline
+                        backoff = min(backoff, self._max_wait_time)
+                    self._skip_receive_until[partition_id] = now + backoff
+
+            if not polled_any and earliest_due is not None:
+                # every owned partition is inside its backoff window; block
+                # until the first one comes due instead of spinning. stop()
+                # sets the event, so shutdown isn't delayed by the wait.
+                self._stop_event.wait(max(earliest_due - time.time(), 0))
 
         with self._lock:
             for partition_id, consumer in list(self._consumers.items()):
@@ -392,4 +465,8 @@ class EventProcessor(EventProcessorMixin):  # pylint:disable=too-many-instance-a
             return
 
         self._running = False
+        self._stop_event.set()
+        if isinstance(self._checkpoint_store, CheckpointCoalescer):
+            # write out any checkpoints still waiting for the next flush tick
+            self._checkpoint_store.close()
         _LOGGER.info("EventProcessor %r has been stopped.", self._id)
@@ -171,6 +171,43 @@ class OwnershipManager:  # pylint:disable=too-many-instance-attributes
                         random_chosen_to_claim["owner_id"] = self.owner_id
                         to_claim.append(random_chosen_to_claim)
                     to_try_steal = False  # already greedily got at least one
+            elif self.load_balancing_strategy is LoadBalancingStrategy.STICKY:
+                # Keep every partition already owned and claim only unowned or
+                # expired ones, up to a deterministic fair share: owners ranked
+                # by id get the floor share, with the remainder going to the
+                # lowest ranks. Each owner prefers a disjoint stride slice of
+                # the claimable list so concurrent sticky owners don't race for
+                # the same partitions. Stealing from an active owner is left to
+                # the shared fallback below, so links are only rebuilt when the
+                # minimum reassignment requires it.
+                all_owner_ids = sorted(set(active_ownership_by_owner) | {self.owner_id})
+                owner_rank = all_owner_ids.index(self.owner_id)
+                allowed_count = expected_count_per_owner + (
+                    1 if owner_rank < all_partition_count % owners_count else 0
+                )
+                preferred_claim_ids = claimable_partition_ids[owner_rank::owners_count]
+                to_sticky_claim_ids = preferred_claim_ids[: max(allowed_count - len(active_ownership_self), 0)]
+                if not to_sticky_claim_ids and claimable_partition_ids:
+                    # the stride slice can come up empty while unowned
+                    # partitions remain (e.g. fewer claimables than owners);
+                    # claim from the full list before resorting to stealing
+                    to_sticky_claim_ids = claimable_partition_ids[
+                        : max(allowed_count - len(active_ownership_self), 0)
+                    ]
+                if to_sticky_claim_ids:
+                    for pid in to_sticky_claim_ids:
+                        sticky_chosen_to_claim = ownership_dict.get(
+                            pid,
+                            {
+                                "fully_qualified_namespace": self.fully_qualified_namespace,
+                                "partition_id": pid,
+                                "eventhub_name": self.eventhub_name,
+                                "consumer_group": self.consumer_group,
+                            },
+                        )
+                        sticky_chosen_to_claim["owner_id"] = self.owner_id
+                        to_claim.append(sticky_chosen_to_claim)
+                    to_try_steal = False  # got at least one without disturbing active owners
             else:  # self.load_balancing_strategy is LoadBalancingStrategy.BALANCED
                 if claimable_partition_ids:  # claim an inactive partition if there is
                     random_partition_id = random.choice(claimable_partition_ids)
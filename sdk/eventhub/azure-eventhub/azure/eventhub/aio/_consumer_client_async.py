@@ -121,6 +121,10 @@ class EventHubConsumerClient(ClientBaseAsync):  # pylint: disable=client-accepts
      load-balancing evaluation, will grab as many unclaimed partitions required to balance the load.
      Use "balanced" or `LoadBalancingStrategy.BALANCED` for the balanced strategy, which, for every load-balancing
      evaluation, claims only one partition that is not claimed by other `EventHubConsumerClient`.
+     Use "sticky" or `LoadBalancingStrategy.STICKY` for the sticky strategy, which keeps the partitions a client
+     already owns and claims only unclaimed or expired partitions up to a deterministic fair share, minimizing the
+     partition movement (and the AMQP link rebuilds and prefetch refills that come with it) when clients join or
+     leave.
      If all partitions of an EventHub are claimed by other `EventHubConsumerClient` and this client has claimed
      too few partitions, this client will steal one partition from other clients for every load-balancing
      evaluation regardless of the load balancing strategy.
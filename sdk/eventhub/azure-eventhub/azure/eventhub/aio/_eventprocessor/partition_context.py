@@ -22,6 +22,15 @@ class PartitionContext:
     Users can call `update_checkpoint()` of this class to persist checkpoint data.
     """
 
+    __slots__ = (
+        "fully_qualified_namespace",
+        "partition_id",
+        "eventhub_name",
+        "consumer_group",
+        "_checkpoint_store",
+        "_last_received_event",
+    )
+
     def __init__(
         self,
         fully_qualified_namespace: str,
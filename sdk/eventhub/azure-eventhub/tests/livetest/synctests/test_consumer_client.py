@@ -125,7 +125,7 @@ def test_receive_no_partition(auth_credential_senders, uamqp_transport, client_a
         worker.start()
         time.sleep(20)
         assert on_event.received == 2
-        checkpoints = list(client._event_processors.values())[0]._checkpoint_store.list_checkpoints(
+        checkpoints = client._event_processors["$default"][ALL_PARTITIONS]._checkpoint_store.list_checkpoints(
             on_event.namespace, on_event.eventhub_name, on_event.consumer_group
         )
         assert len([checkpoint for checkpoint in checkpoints if checkpoint["offset"] == on_event.offset]) > 0
@@ -211,8 +211,8 @@ def test_receive_load_balancing(auth_credential_senders, uamqp_transport, client
         time.sleep(3.3)
         worker2.start()
         time.sleep(20)
-        assert len(client1._event_processors[("$default", ALL_PARTITIONS)]._consumers) == 1
-        assert len(client2._event_processors[("$default", ALL_PARTITIONS)]._consumers) == 1
+        assert len(client1._event_processors["$default"][ALL_PARTITIONS]._consumers) == 1
+        assert len(client2._event_processors["$default"][ALL_PARTITIONS]._consumers) == 1
 
 
 def test_receive_batch_no_max_wait_time(auth_credential_senders, uamqp_transport, client_args):
@@ -255,7 +255,7 @@ def test_receive_batch_no_max_wait_time(auth_credential_senders, uamqp_transport
         time.sleep(20)
         assert on_event_batch.received == 2
 
-        checkpoints = list(client._event_processors.values())[0]._checkpoint_store.list_checkpoints(
+        checkpoints = client._event_processors["$default"][ALL_PARTITIONS]._checkpoint_store.list_checkpoints(
             on_event_batch.namespace,
             on_event_batch.eventhub_name,
             on_event_batch.consumer_group,
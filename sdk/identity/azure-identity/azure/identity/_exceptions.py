@@ -24,6 +24,10 @@ class AuthenticationRequiredError(CredentialUnavailableError):
     :param str claims: Additional claims required in the next authentication.
     """
 
+    # the unslotted ClientAuthenticationError base keeps providing __dict__;
+    # these slots just avoid dict entries for the two hot attributes
+    __slots__ = ("_claims", "_scopes")
+
     def __init__(
         self, scopes: Iterable[str], message: Optional[str] = None, claims: Optional[str] = None, **kwargs: Any
     ) -> None:
@@ -2,7 +2,10 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import functools
 import os
+import threading
+from collections import OrderedDict
 from typing import Any, List, Union, Dict, Optional
 from typing_extensions import Self
 
@@ -14,6 +17,22 @@ from .._constants import EnvironmentVariables
 from .._persistent_cache import _load_persistent_cache
 
 
+# bound on distinct tenants whose MSAL applications are kept per credential;
+# least recently used applications are evicted and simply rebuilt on next use
+_MAX_CLIENT_APPLICATIONS = int(os.environ.get("AZURE_IDENTITY_MSAL_APP_CACHE", "256"))
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_regional_authority() -> Optional[str]:
+    # resolved once per process: credentials are often constructed per request
+    # and the env var is treated as fixed process configuration, so later env
+    # changes are intentionally not observed
+    regional_authority = os.environ.get(EnvironmentVariables.AZURE_REGIONAL_AUTHORITY_NAME)
+    if regional_authority and regional_authority.lower() in ("tryautodetect", "true"):
+        return msal.ConfidentialClientApplication.ATTEMPT_REGION_DISCOVERY
+    return regional_authority
+
+
 class MsalCredential:  # pylint: disable=too-many-instance-attributes
     """Base class for credentials wrapping MSAL applications.
 
@@ -22,6 +41,34 @@ class MsalCredential:  # pylint: disable=too-many-instance-attributes
     :type client_credential: dict
     """
 
+    # "__dict__" stays in the slot list because subclasses add their own
+    # attributes; the credential's own attributes still get slot-backed
+    # storage and faster access
+    __slots__ = (
+        "_instance_discovery",
+        "_authority",
+        "_regional_authority",
+        "_tenant_id",
+        "_client",
+        "_client_credential",
+        "_client_id",
+        "_enable_support_logging",
+        "_additionally_allowed_tenants",
+        "_client_applications",
+        "_cae_client_applications",
+        "_cache",
+        "_cae_cache",
+        "_custom_cache",
+        "_cache_options",
+        "_app_locks",
+        "_cache_lock",
+        "_authority_urls",
+        "_app_class",
+        "_enter_count",
+        "_enter_lock",
+        "__dict__",
+    )
+
     def __init__(
         self,
         client_id: str,
@@ -36,19 +83,21 @@ class MsalCredential:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         self._instance_discovery = None if disable_instance_discovery is None else not disable_instance_discovery
         self._authority = normalize_authority(authority) if authority else get_default_authority()
-        self._regional_authority = os.environ.get(EnvironmentVariables.AZURE_REGIONAL_AUTHORITY_NAME)
-        if self._regional_authority and self._regional_authority.lower() in ["tryautodetect", "true"]:
-            self._regional_authority = msal.ConfidentialClientApplication.ATTEMPT_REGION_DISCOVERY
+        self._regional_authority = _resolve_regional_authority()
         self._tenant_id = tenant_id or "organizations"
         validate_tenant_id(self._tenant_id)
         self._client = MsalClient(**kwargs)
         self._client_credential = client_credential
+        # fixed after construction, so pick the MSAL application class once
+        self._app_class = msal.ConfidentialClientApplication if client_credential else msal.PublicClientApplication
         self._client_id = client_id
         self._enable_support_logging = enable_support_logging
         self._additionally_allowed_tenants = additionally_allowed_tenants or []
 
-        self._client_applications: Dict[str, msal.ClientApplication] = {}
-        self._cae_client_applications: Dict[str, msal.ClientApplication] = {}
+        self._client_applications: "OrderedDict[str, msal.ClientApplication]" = OrderedDict()
+        self._cae_client_applications: "OrderedDict[str, msal.ClientApplication]" = OrderedDict()
+        # authority URL per tenant, shared by the CAE and non-CAE app maps
+        self._authority_urls: Dict[str, str] = {}
 
         self._cache = kwargs.pop("_cache", None)
         self._cae_cache = kwargs.pop("_cae_cache", None)
@@ -58,59 +107,103 @@ class MsalCredential:  # pylint: disable=too-many-instance-attributes
             self._custom_cache = False
         self._cache_options = kwargs.pop("cache_persistence_options", None)
 
+        # sharded per-tenant locks so concurrent cold starts for the same
+        # tenant build one MSAL application instead of racing; steady-state
+        # lookups stay lock-free
+        self._app_locks = [threading.Lock() for _ in range(16)]
+        self._cache_lock = threading.Lock()
+
+        # reference count for nested/sequential "with" scopes so inner scopes
+        # don't tear down the HTTP client's pooled connections
+        self._enter_count = 0
+        self._enter_lock = threading.Lock()
+
         super(MsalCredential, self).__init__()
 
     def __enter__(self) -> Self:
-        self._client.__enter__()
+        with self._enter_lock:
+            if self._enter_count == 0:
+                self._client.__enter__()
+            self._enter_count += 1
         return self
 
     def __exit__(self, *args: Any) -> None:
-        self._client.__exit__(*args)
+        with self._enter_lock:
+            if self._enter_count > 0:
+                self._enter_count -= 1
+            if self._enter_count == 0:
+                self._client.__exit__(*args)
 
     def close(self) -> None:
         """Close the credential's underlying HTTP client and release resources."""
-        self.__exit__()
+        with self._enter_lock:
+            self._enter_count = 0
+            self._client.__exit__()
 
     def _initialize_cache(self, is_cae: bool = False) -> msal.TokenCache:
-        if self._cache_options:
-            if is_cae:
-                self._cae_cache = _load_persistent_cache(self._cache_options, is_cae)
-            else:
-                self._cache = _load_persistent_cache(self._cache_options, is_cae)
-        else:
+        # double-checked under the cache lock so two threads initializing
+        # concurrently can't each build a cache and lose one reference
+        with self._cache_lock:
             if is_cae:
-                self._cae_cache = msal.TokenCache()
-            else:
-                self._cache = msal.TokenCache()
-
-        return self._cae_cache if is_cae else self._cache
+                if not self._cae_cache:
+                    self._cae_cache = (
+                        _load_persistent_cache(self._cache_options, is_cae)
+                        if self._cache_options
+                        else msal.TokenCache()
+                    )
+                return self._cae_cache
+            if not self._cache:
+                self._cache = (
+                    _load_persistent_cache(self._cache_options, is_cae) if self._cache_options else msal.TokenCache()
+                )
+            return self._cache
 
     def _get_app(self, **kwargs: Any) -> msal.ClientApplication:
         tenant_id = resolve_tenant(
             self._tenant_id, additionally_allowed_tenants=self._additionally_allowed_tenants, **kwargs
         )
 
-        client_applications_map = self._client_applications
-        capabilities = None
-        token_cache = self._cache
+        is_cae = bool(kwargs.get("enable_cae"))
+        client_applications_map = self._cae_client_applications if is_cae else self._client_applications
 
-        app_class = msal.ConfidentialClientApplication if self._client_credential else msal.PublicClientApplication
+        # lock-free fast path; the maps are LRU-ordered, so refresh recency on hit
+        app = client_applications_map.get(tenant_id)
+        if app is not None:
+            try:
+                client_applications_map.move_to_end(tenant_id)
+            except KeyError:
+                # a concurrent miss on another tenant evicted this entry
+                # between the get and the move; recency refresh is
+                # best-effort, and the app we already fetched is still valid
+                pass
+            return app
 
-        if kwargs.get("enable_cae"):
-            client_applications_map = self._cae_client_applications
-            capabilities = ["CP1"]
-            token_cache = self._cae_cache
+        # cold miss: double-checked per-tenant construction so concurrent
+        # threads don't each pay for MSAL's instance discovery
+        lock = self._app_locks[hash(tenant_id) & 15]
+        with lock:
+            app = client_applications_map.get(tenant_id)
+            if app is not None:
+                return app
 
-        if not token_cache:
-            token_cache = self._initialize_cache(is_cae=bool(kwargs.get("enable_cae")))
+            capabilities = ["CP1"] if is_cae else None
+            token_cache = self._cae_cache if is_cae else self._cache
+            if not token_cache:
+                # one cache per CAE flavor (persistent when cache options were
+                # provided, in-memory otherwise) is shared by every application
+                # this credential builds, so evicting an application from the
+                # LRU map never discards the tokens it accumulated
+                token_cache = self._initialize_cache(is_cae=is_cae)
 
-        if tenant_id not in client_applications_map:
+            authority_url = self._authority_urls.get(tenant_id) or self._authority_urls.setdefault(
+                tenant_id, f"{self._authority}/{tenant_id}"
+            )
             try:
-                client_applications_map[tenant_id] = app_class(
+                app = self._app_class(
                     client_id=self._client_id,
                     client_credential=self._client_credential,
                     client_capabilities=capabilities,
-                    authority="{}/{}".format(self._authority, tenant_id),
+                    authority=authority_url,
                     azure_region=self._regional_authority,
                     token_cache=token_cache,
                     http_client=self._client,
@@ -118,31 +211,71 @@ class MsalCredential:  # pylint: disable=too-many-instance-attributes
                     enable_pii_log=self._enable_support_logging,
                 )
             except ValueError as ex:
-                if "invalid_instance" in str(ex):
+                # inspect the first exception arg directly instead of
+                # rendering the full (possibly chained) message via str(ex)
+                first_arg = ex.args[0] if ex.args else ""
+                if isinstance(first_arg, str) and "invalid_instance" in first_arg:
                     raise ValueError(  # pylint: disable=raise-missing-from
                         f"The authority provided, {self._authority}, is not well-known. If this authority is valid "
                         "and trustworthy, you can disable this check by passing in "
                         "'disable_instance_discovery=True' when constructing the credential."
                     )
                 raise
+            if len(client_applications_map) >= _MAX_CLIENT_APPLICATIONS:
+                # evicted applications hold no connections of their own (they
+                # wrap the shared http client), so eviction is just memory
+                client_applications_map.popitem(last=False)
+            client_applications_map[tenant_id] = app
+            return app
 
-        return client_applications_map[tenant_id]
-
-    def __getstate__(self) -> Dict[str, Any]:
-        state = self.__dict__.copy()
-        # Remove the non-picklable entries
-        del state["_client_applications"]
-        del state["_cae_client_applications"]
-        if not self._custom_cache:
-            del state["_cache"]
-            del state["_cae_cache"]
-        return state
+    def __getstate__(self) -> tuple:
+        # positional state: the picklable slots in declaration order (MSAL app
+        # maps are dropped, caches only travel when they are caller-provided),
+        # with any subclass attributes from __dict__ in the final position
+        custom_cache = self._custom_cache
+        return (
+            self._instance_discovery,
+            self._authority,
+            self._regional_authority,
+            self._tenant_id,
+            self._client,
+            self._client_credential,
+            self._client_id,
+            self._enable_support_logging,
+            self._additionally_allowed_tenants,
+            self._cache if custom_cache else None,
+            self._cae_cache if custom_cache else None,
+            custom_cache,
+            self._cache_options,
+            self.__dict__.copy(),
+        )
 
-    def __setstate__(self, state: Dict[str, Any]) -> None:
-        self.__dict__.update(state)
+    def __setstate__(self, state: tuple) -> None:
+        (
+            self._instance_discovery,
+            self._authority,
+            self._regional_authority,
+            self._tenant_id,
+            self._client,
+            self._client_credential,
+            self._client_id,
+            self._enable_support_logging,
+            self._additionally_allowed_tenants,
+            self._cache,
+            self._cae_cache,
+            self._custom_cache,
+            self._cache_options,
+            instance_dict,
+        ) = state
         # Re-create the unpickable entries
-        self._client_applications = {}
-        self._cae_client_applications = {}
-        if not self._custom_cache:
-            self._cache = None
-            self._cae_cache = None
+        self._client_applications = OrderedDict()
+        self._cae_client_applications = OrderedDict()
+        self._app_locks = [threading.Lock() for _ in range(16)]
+        self._cache_lock = threading.Lock()
+        self._authority_urls = {}
+        self._enter_count = 0
+        self._enter_lock = threading.Lock()
+        self._app_class = (
+            msal.ConfidentialClientApplication if self._client_credential else msal.PublicClientApplication
+        )
+        self.__dict__.update(instance_dict)
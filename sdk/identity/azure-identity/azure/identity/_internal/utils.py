@@ -4,6 +4,7 @@
 # ------------------------------------
 import base64
 import os
+import re
 import platform
 import logging
 import time
@@ -29,6 +30,9 @@ within_dac = ContextVar("within_dac", default=False)
 _LOGGER = logging.getLogger(__name__)
 
 VALID_TENANT_ID_CHARACTERS = frozenset(ascii_letters + digits + "-.")
+# compiled once: tenant ids are validated on every credential construction,
+# and a C-level regex scan beats a Python-level per-character loop
+_VALID_TENANT_ID_PATTERN = re.compile(r"[a-zA-Z0-9\-.]+\Z")
 VALID_SCOPE_CHARACTERS = frozenset(ascii_letters + digits + "_-.:/")
 VALID_SUBSCRIPTION_CHARACTERS = frozenset(ascii_letters + digits + "_-. ")
 
@@ -109,7 +113,7 @@ def validate_tenant_id(tenant_id: str) -> None:
     :param str tenant_id: tenant ID to validate
     :raises: ValueError if tenant_id is empty or contains a character invalid for a tenant ID.
     """
-    if not tenant_id or any(c not in VALID_TENANT_ID_CHARACTERS for c in tenant_id):
+    if not tenant_id or not _VALID_TENANT_ID_PATTERN.match(tenant_id):
         raise ValueError(
             "Invalid tenant ID provided. You can locate your tenant ID by following the instructions here: "
             "https://learn.microsoft.com/partner-center/find-ids-and-domain-names"
@@ -10,6 +10,7 @@ from azure.core.pipeline.policies import ContentDecodePolicy, SansIOHTTPPolicy
 from azure.identity import CertificateCredential, TokenCachePersistenceOptions
 from azure.identity._enums import RegionalAuthority
 from azure.identity._constants import EnvironmentVariables
+from azure.identity._internal.msal_credentials import _resolve_regional_authority
 from azure.identity._credentials.certificate import load_pkcs12_certificate, get_client_credential
 from azure.identity._internal.user_agent import USER_AGENT
 from cryptography import x509
@@ -187,6 +188,9 @@ def test_regional_authority(get_token_method):
 
     for region in RegionalAuthority:
         mock_confidential_client.reset_mock()
+        # the environment variable is resolved once per process, so clear the
+        # cached value before reconfiguring it
+        _resolve_regional_authority.cache_clear()
 
         # region can be configured via environment variable
         with patch.dict("os.environ", {EnvironmentVariables.AZURE_REGIONAL_AUTHORITY_NAME: region.value}, clear=True):
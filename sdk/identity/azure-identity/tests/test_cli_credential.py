@@ -3,7 +3,7 @@
 # Licensed under the MIT License.
 # ------------------------------------
 from datetime import datetime
-from itertools import product
+import functools
 import json
 import re
 
@@ -19,6 +19,9 @@ from helpers import mock, INVALID_CHARACTERS, INVALID_SUBSCRIPTION_CHARACTERS, G
 
 CHECK_OUTPUT = AzureCliCredential.__module__ + ".subprocess.check_output"
 
+# tests that don't assert on expiry don't need a real timestamp
+FIXED_EXPIRES_ON = "2099-01-01 00:00:00.000000"
+
 TEST_ERROR_OUTPUTS = (
     '{"accessToken": "secret value',
     '{"accessToken": "secret value"',
@@ -31,12 +34,39 @@ TEST_ERROR_OUTPUTS = (
 )
 
 
+# the parametrized token-exposure tests build the same errors len(TEST_ERROR_OUTPUTS) * len(GET_TOKEN_METHODS)
+# times, so cache the exception instances; the Mock stays fresh per call because it records call state
+@functools.lru_cache(maxsize=None)
+def _called_process_error(return_code, output="", cmd="...", stderr=""):
+    return subprocess.CalledProcessError(return_code, cmd=cmd, output=output, stderr=stderr)
+
+
 def raise_called_process_error(return_code, output="", cmd="...", stderr=""):
-    error = subprocess.CalledProcessError(return_code, cmd=cmd, output=output, stderr=stderr)
-    return mock.Mock(side_effect=error)
+    return mock.Mock(side_effect=_called_process_error(return_code, output, cmd, stderr))
+
+
+@pytest.fixture(params=GET_TOKEN_METHODS)
+def get_token_method(request):
+    """Parametrize every test over the token-acquisition methods without per-test decorators."""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def default_cred():
+    """One shared no-argument credential for tests that don't exercise the constructor."""
+    return AzureCliCredential()
+
+
+@pytest.fixture(autouse=True)
+def az_on_path(monkeypatch):
+    """Make the CLI discoverable for every test; monkeypatch is cheaper than a per-test mock.patch.
+
+    Tests that need the CLI to be missing (e.g. test_cli_not_installed) still override this
+    with their own patch.
+    """
+    monkeypatch.setattr("shutil.which", lambda *_: "az")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_no_scopes(get_token_method):
     """The credential should raise ValueError when get_token is called with no scopes"""
 
@@ -44,7 +74,6 @@ def test_no_scopes(get_token_method):
         getattr(AzureCliCredential(), get_token_method)()
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_multiple_scopes(get_token_method):
     """The credential should raise ValueError when get_token is called with more than one scope"""
 
@@ -52,7 +81,6 @@ def test_multiple_scopes(get_token_method):
         getattr(AzureCliCredential(), get_token_method)("one scope", "and another")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_invalid_tenant_id(get_token_method):
     """Invalid tenant IDs should raise ValueErrors."""
 
@@ -67,7 +95,6 @@ def test_invalid_tenant_id(get_token_method):
             getattr(AzureCliCredential(), get_token_method)("scope", **kwargs)
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_invalid_scopes(get_token_method):
     """Scopes with invalid characters should raise ValueErrors."""
 
@@ -76,7 +103,6 @@ def test_invalid_scopes(get_token_method):
             getattr(AzureCliCredential(), get_token_method)("scope" + c)
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_subscription(get_token_method):
     """The credential should accept a subscription ID"""
 
@@ -84,24 +110,27 @@ def test_subscription(get_token_method):
     credential = AzureCliCredential(subscription=subscription)
     assert credential.subscription == subscription
 
+    successful_output = json.dumps(
+        {
+            "expiresOn": FIXED_EXPIRES_ON,
+            "accessToken": "access-token",
+            "subscription": subscription,
+            "tenant": "tenant",
+            "tokenType": "Bearer",
+        }
+    )
+
     def fake_check_output(command_line, **_):
-        assert "--subscription" in command_line
-        subscription_id_index = command_line.index("--subscription")
+        try:
+            subscription_id_index = command_line.index("--subscription")
+        except ValueError:
+            pytest.fail("--subscription missing from command line")
         assert command_line[subscription_id_index + 1]
-        return json.dumps(
-            {
-                "expiresOn": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
-                "accessToken": "access-token",
-                "subscription": subscription,
-                "tenant": "tenant",
-                "tokenType": "Bearer",
-            }
-        )
+        return successful_output
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, fake_check_output):
-            token = getattr(credential, get_token_method)("scope")
-            assert token.token == "access-token"
+    with mock.patch(CHECK_OUTPUT, fake_check_output):
+        token = getattr(credential, get_token_method)("scope")
+        assert token.token == "access-token"
 
 
 def test_invalid_subscriptons():
@@ -112,8 +141,7 @@ def test_invalid_subscriptons():
             AzureCliCredential(subscription="subscription" + c)
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_get_token(get_token_method):
+def test_get_token(get_token_method, default_cred):
     """The credential should parse the CLI's output to an AccessToken"""
 
     access_token = "access token"
@@ -128,17 +156,15 @@ def test_get_token(get_token_method):
         }
     )
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
-            token = getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
+        token = getattr(default_cred, get_token_method)("scope")
 
     assert token.token == access_token
     assert type(token.expires_on) == int
     assert token.expires_on == expected_expires_on
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_expires_on_used(get_token_method):
+def test_expires_on_used(get_token_method, default_cred):
     """Test that 'expires_on' is preferred over 'expiresOn'."""
     expires_on = 1602015811
     successful_output = json.dumps(
@@ -152,15 +178,13 @@ def test_expires_on_used(get_token_method):
         }
     )
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
-            token = getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
+        token = getattr(default_cred, get_token_method)("scope")
 
     assert token.expires_on == expires_on
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_expires_on_string(get_token_method):
+def test_expires_on_string(get_token_method, default_cred):
     """Test that 'expires_on' still works if it's a string."""
     expires_on = 1602015811
     successful_output = json.dumps(
@@ -173,113 +197,97 @@ def test_expires_on_string(get_token_method):
         }
     )
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
-            token = getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=successful_output)):
+        token = getattr(default_cred, get_token_method)("scope")
 
     assert type(token.expires_on) == int
     assert token.expires_on == expires_on
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_cli_not_installed(get_token_method):
+def test_cli_not_installed(get_token_method, default_cred):
     """The credential should raise CredentialUnavailableError when the CLI isn't installed"""
     with mock.patch("shutil.which", return_value=None):
         with pytest.raises(CredentialUnavailableError, match=CLI_NOT_FOUND):
-            getattr(AzureCliCredential(), get_token_method)("scope")
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_cannot_execute_shell(get_token_method):
+def test_cannot_execute_shell(get_token_method, default_cred):
     """The credential should raise CredentialUnavailableError when the subprocess doesn't start"""
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(side_effect=OSError())):
-            with pytest.raises(CredentialUnavailableError):
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(side_effect=OSError())):
+        with pytest.raises(CredentialUnavailableError):
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_not_logged_in(get_token_method):
+def test_not_logged_in(get_token_method, default_cred):
     """When the CLI isn't logged in, the credential should raise CredentialUnavailableError"""
 
     stderr = "ERROR: Please run 'az login' to setup account."
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, stderr=stderr)):
-            with pytest.raises(CredentialUnavailableError, match=NOT_LOGGED_IN):
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, stderr=stderr)):
+        with pytest.raises(CredentialUnavailableError, match=NOT_LOGGED_IN):
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_aadsts_error(get_token_method):
+def test_aadsts_error(get_token_method, default_cred):
     """When the CLI isn't logged in, the credential should raise CredentialUnavailableError"""
 
     stderr = "ERROR: AADSTS70043: The refresh token has expired, Please run 'az login' to setup account."
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, stderr=stderr)):
-            with pytest.raises(ClientAuthenticationError, match=stderr):
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, stderr=stderr)):
+        with pytest.raises(ClientAuthenticationError, match=stderr):
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_unexpected_error(get_token_method):
+def test_unexpected_error(get_token_method, default_cred):
     """When the CLI returns an unexpected error, the credential should raise an error containing the CLI's output"""
 
     stderr = "something went wrong"
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, raise_called_process_error(42, stderr=stderr)):
-            with pytest.raises(ClientAuthenticationError, match=stderr):
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, raise_called_process_error(42, stderr=stderr)):
+        with pytest.raises(ClientAuthenticationError, match=stderr):
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
-def test_unexpected_error_no_stderr(get_token_method):
+def test_unexpected_error_no_stderr(get_token_method, default_cred):
     """When the CLI returns an unexpected error with no stderr captured, the credential should raise an error with a str output"""
 
     stderr = None
     default_message = "Failed to invoke Azure CLI"
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, raise_called_process_error(42, stderr=stderr)):
-            with pytest.raises(ClientAuthenticationError, match=stderr):
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, raise_called_process_error(42, stderr=stderr)):
+        with pytest.raises(ClientAuthenticationError, match=stderr):
+            getattr(default_cred, get_token_method)("scope")
 
 
-@pytest.mark.parametrize("output,get_token_method", product(TEST_ERROR_OUTPUTS, GET_TOKEN_METHODS))
-def test_parsing_error_does_not_expose_token(output, get_token_method):
+@pytest.mark.parametrize("output", TEST_ERROR_OUTPUTS)
+def test_parsing_error_does_not_expose_token(output, get_token_method, default_cred):
     """Errors during CLI output parsing shouldn't expose access tokens in that output"""
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=output)):
-            with pytest.raises(ClientAuthenticationError) as ex:
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(return_value=output)):
+        with pytest.raises(ClientAuthenticationError) as ex:
+            getattr(default_cred, get_token_method)("scope")
 
     assert "secret value" not in str(ex.value)
     assert "secret value" not in repr(ex.value)
 
 
-@pytest.mark.parametrize("output,get_token_method", product(TEST_ERROR_OUTPUTS, GET_TOKEN_METHODS))
-def test_subprocess_error_does_not_expose_token(output, get_token_method):
+@pytest.mark.parametrize("output", TEST_ERROR_OUTPUTS)
+def test_subprocess_error_does_not_expose_token(output, get_token_method, default_cred):
     """Errors from the subprocess shouldn't expose access tokens in CLI output"""
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, output=output)):
-            with pytest.raises(ClientAuthenticationError) as ex:
-                getattr(AzureCliCredential(), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, raise_called_process_error(1, output=output)):
+        with pytest.raises(ClientAuthenticationError) as ex:
+            getattr(default_cred, get_token_method)("scope")
 
     assert "secret value" not in str(ex.value)
     assert "secret value" not in repr(ex.value)
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_timeout(get_token_method):
     """The credential should raise CredentialUnavailableError when the subprocess times out"""
 
     from subprocess import TimeoutExpired
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, mock.Mock(side_effect=TimeoutExpired("", 42))) as check_output_mock:
-            with pytest.raises(CredentialUnavailableError):
-                getattr(AzureCliCredential(process_timeout=42), get_token_method)("scope")
+    with mock.patch(CHECK_OUTPUT, mock.Mock(side_effect=TimeoutExpired("", 42))) as check_output_mock:
+        with pytest.raises(CredentialUnavailableError):
+            getattr(AzureCliCredential(process_timeout=42), get_token_method)("scope")
 
     # Ensure custom timeout is passed to subprocess
     _, kwargs = check_output_mock.call_args
@@ -287,117 +295,130 @@ def test_timeout(get_token_method):
     assert kwargs["timeout"] == 42
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_multitenant_authentication_class(get_token_method):
     default_tenant = "first-tenant"
     first_token = "***"
     second_tenant = "second-tenant"
     second_token = first_token * 2
 
-    def fake_check_output(command_line, **_):
-        tenant_index = command_line.index("--tenant") if "--tenant" in command_line else None
-        tenant = command_line[tenant_index + 1] if tenant_index is not None else default_tenant
-        assert tenant in (default_tenant, second_tenant), 'unexpected tenant "{}"'.format(tenant)
-        return json.dumps(
+    # serialize each tenant's output once; the fake runs several times per test
+    tenant_outputs = {
+        tenant: json.dumps(
             {
-                "expiresOn": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+                "expiresOn": FIXED_EXPIRES_ON,
                 "accessToken": first_token if tenant == default_tenant else second_token,
                 "subscription": "some-guid",
                 "tenant": tenant,
                 "tokenType": "Bearer",
             }
         )
+        for tenant in (default_tenant, second_tenant)
+    }
+
+    def fake_check_output(command_line, **_):
+        try:
+            tenant = command_line[command_line.index("--tenant") + 1]
+        except ValueError:
+            tenant = default_tenant
+        assert tenant in tenant_outputs, 'unexpected tenant "{}"'.format(tenant)
+        return tenant_outputs[tenant]
 
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, fake_check_output):
-            token = getattr(AzureCliCredential(), get_token_method)("scope")
-            assert token.token == first_token
+    with mock.patch(CHECK_OUTPUT, fake_check_output):
+        token = getattr(AzureCliCredential(), get_token_method)("scope")
+        assert token.token == first_token
 
-            token = getattr(AzureCliCredential(tenant_id=default_tenant), get_token_method)("scope")
-            assert token.token == first_token
+        token = getattr(AzureCliCredential(tenant_id=default_tenant), get_token_method)("scope")
+        assert token.token == first_token
 
-            token = getattr(AzureCliCredential(tenant_id=second_tenant), get_token_method)("scope")
-            assert token.token == second_token
+        token = getattr(AzureCliCredential(tenant_id=second_tenant), get_token_method)("scope")
+        assert token.token == second_token
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_multitenant_authentication(get_token_method):
     default_tenant = "first-tenant"
     first_token = "***"
     second_tenant = "second-tenant"
     second_token = first_token * 2
 
-    def fake_check_output(command_line, **_):
-        tenant_index = command_line.index("--tenant") if "--tenant" in command_line else None
-        tenant = command_line[tenant_index + 1] if tenant_index is not None else default_tenant
-        assert tenant in (default_tenant, second_tenant), 'unexpected tenant "{}"'.format(tenant)
-        return json.dumps(
+    # serialize each tenant's output once; the fake runs several times per test
+    tenant_outputs = {
+        tenant: json.dumps(
             {
-                "expiresOn": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+                "expiresOn": FIXED_EXPIRES_ON,
                 "accessToken": first_token if tenant == default_tenant else second_token,
                 "subscription": "some-guid",
                 "tenant": tenant,
                 "tokenType": "Bearer",
             }
         )
+        for tenant in (default_tenant, second_tenant)
+    }
+
+    def fake_check_output(command_line, **_):
+        try:
+            tenant = command_line[command_line.index("--tenant") + 1]
+        except ValueError:
+            tenant = default_tenant
+        assert tenant in tenant_outputs, 'unexpected tenant "{}"'.format(tenant)
+        return tenant_outputs[tenant]
 
     credential = AzureCliCredential()
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, fake_check_output):
-            token = getattr(credential, get_token_method)("scope")
-            assert token.token == first_token
+    with mock.patch(CHECK_OUTPUT, fake_check_output):
+        token = getattr(credential, get_token_method)("scope")
+        assert token.token == first_token
 
-            kwargs = {"tenant_id": default_tenant}
-            if get_token_method == "get_token_info":
-                kwargs = {"options": kwargs}
-            token = getattr(credential, get_token_method)("scope", **kwargs)
-            assert token.token == first_token
+        kwargs = {"tenant_id": default_tenant}
+        if get_token_method == "get_token_info":
+            kwargs = {"options": kwargs}
+        token = getattr(credential, get_token_method)("scope", **kwargs)
+        assert token.token == first_token
 
-            kwargs = {"tenant_id": second_tenant}
-            if get_token_method == "get_token_info":
-                kwargs = {"options": kwargs}
-            token = getattr(credential, get_token_method)("scope", **kwargs)
-            assert token.token == second_token
+        kwargs = {"tenant_id": second_tenant}
+        if get_token_method == "get_token_info":
+            kwargs = {"options": kwargs}
+        token = getattr(credential, get_token_method)("scope", **kwargs)
+        assert token.token == second_token
 
-            # should still default to the first tenant
-            token = getattr(credential, get_token_method)("scope")
-            assert token.token == first_token
+        # should still default to the first tenant
+        token = getattr(credential, get_token_method)("scope")
+        assert token.token == first_token
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_multitenant_authentication_not_allowed(get_token_method):
     expected_tenant = "expected-tenant"
     expected_token = "***"
 
+    successful_output = json.dumps(
+        {
+            "expiresOn": FIXED_EXPIRES_ON,
+            "accessToken": expected_token,
+            "subscription": "some-guid",
+            "tenant": expected_token,
+            "tokenType": "Bearer",
+        }
+    )
+
     def fake_check_output(command_line, **_):
-        tenant_index = command_line.index("--tenant") if "--tenant" in command_line else None
-        tenant = command_line[tenant_index + 1] if tenant_index is not None else None
+        try:
+            tenant = command_line[command_line.index("--tenant") + 1]
+        except ValueError:
+            tenant = None
         assert tenant is None or tenant == expected_tenant
-        return json.dumps(
-            {
-                "expiresOn": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
-                "accessToken": expected_token,
-                "subscription": "some-guid",
-                "tenant": expected_token,
-                "tokenType": "Bearer",
-            }
-        )
+        return successful_output
 
     credential = AzureCliCredential()
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(CHECK_OUTPUT, fake_check_output):
-            token = getattr(credential, get_token_method)("scope")
-            assert token.token == expected_token
+    with mock.patch(CHECK_OUTPUT, fake_check_output):
+        token = getattr(credential, get_token_method)("scope")
+        assert token.token == expected_token
 
-            with mock.patch.dict("os.environ", {EnvironmentVariables.AZURE_IDENTITY_DISABLE_MULTITENANTAUTH: "true"}):
-                kwargs = {"tenant_id": "un" + expected_tenant}
-                if get_token_method == "get_token_info":
-                    kwargs = {"options": kwargs}
-                token = getattr(credential, get_token_method)("scope", **kwargs)
-            assert token.token == expected_token
+        with mock.patch.dict("os.environ", {EnvironmentVariables.AZURE_IDENTITY_DISABLE_MULTITENANTAUTH: "true"}):
+            kwargs = {"tenant_id": "un" + expected_tenant}
+            if get_token_method == "get_token_info":
+                kwargs = {"options": kwargs}
+            token = getattr(credential, get_token_method)("scope", **kwargs)
+        assert token.token == expected_token
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_claims_challenge_raises_error(get_token_method):
     """The credential should raise CredentialUnavailableError when claims challenge is provided"""
 
@@ -413,37 +434,34 @@ def test_claims_challenge_raises_error(get_token_method):
         getattr(credential, get_token_method)("scope", **kwargs)
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_empty_claims_does_not_raise_error(get_token_method):
     """The credential should not raise error when claims parameter is empty or None"""
 
     # Mock the CLI to avoid actual invocation
-    with mock.patch("shutil.which", return_value="az"):
-        with mock.patch(
-            CHECK_OUTPUT, mock.Mock(return_value='{"accessToken": "token", "expiresOn": "2021-10-07 12:00:00.000000"}')
-        ):
-            credential = AzureCliCredential()
-
-            # Test with None (default)
-            token = getattr(credential, get_token_method)("scope")
-            assert token.token == "token"
-
-            # Test with empty string claims
-            kwargs = {"claims": ""}
-            if get_token_method == "get_token_info":
-                kwargs = {"options": kwargs}
-            token = getattr(credential, get_token_method)("scope", **kwargs)
-            assert token.token == "token"
+    with mock.patch(
+        CHECK_OUTPUT, mock.Mock(return_value='{"accessToken": "token", "expiresOn": "2021-10-07 12:00:00.000000"}')
+    ):
+        credential = AzureCliCredential()
 
-            # Test with None claims explicitly
-            kwargs = {"claims": None}
-            if get_token_method == "get_token_info":
-                kwargs = {"options": kwargs}
-            token = getattr(credential, get_token_method)("scope", **kwargs)
-            assert token.token == "token"
+        # Test with None (default)
+        token = getattr(credential, get_token_method)("scope")
+        assert token.token == "token"
+
+        # Test with empty string claims
+        kwargs = {"claims": ""}
+        if get_token_method == "get_token_info":
+            kwargs = {"options": kwargs}
+        token = getattr(credential, get_token_method)("scope", **kwargs)
+        assert token.token == "token"
+
+        # Test with None claims explicitly
+        kwargs = {"claims": None}
+        if get_token_method == "get_token_info":
+            kwargs = {"options": kwargs}
+        token = getattr(credential, get_token_method)("scope", **kwargs)
+        assert token.token == "token"
 
 
-@pytest.mark.parametrize("get_token_method", GET_TOKEN_METHODS)
 def test_claims_challenge_with_tenant(get_token_method):
     """The credential should include tenant in the error message when claims and tenant are provided"""
 
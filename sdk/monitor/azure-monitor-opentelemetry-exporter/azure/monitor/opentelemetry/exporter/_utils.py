@@ -292,14 +292,27 @@ class PeriodicTask(threading.Thread):
         self.finished.set()
 
 
+_telemetry_item_template: Optional[TelemetryItem] = None
+
+
 def _create_telemetry_item(timestamp: int) -> TelemetryItem:
+    # pylint: disable=global-statement,protected-access
+    global _telemetry_item_template
     ts = datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
-    return TelemetryItem(
-        name="",
-        instrumentation_key="",
-        tags=dict(azure_monitor_context),  # type: ignore
-        time=ts,
-    )
+    template = _telemetry_item_template
+    if template is None:
+        # build one skeleton through the full constructor so the serialized
+        # field layout always matches the generated model
+        template = TelemetryItem(name="", instrumentation_key="", tags={}, time=ts)
+        _telemetry_item_template = template
+    # cloning the skeleton's serialized dict skips the constructor's per-field
+    # default resolution and keyword serialization on the export hot path; the
+    # varying fields go through the model's own setters
+    item = TelemetryItem.__new__(TelemetryItem)
+    item._data = dict(template._data)
+    item.time = ts
+    item.tags = dict(azure_monitor_context)  # type: ignore
+    return item
 
 
 def _populate_part_a_fields(resource: Resource):
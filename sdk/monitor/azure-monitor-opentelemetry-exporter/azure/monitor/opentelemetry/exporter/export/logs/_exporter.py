@@ -2,7 +2,8 @@
 # Licensed under the MIT License.
 import json
 import logging
-from typing import Optional, Sequence, Any
+import weakref
+from typing import Optional, Sequence, Any, Tuple
 
 from opentelemetry._logs.severity import SeverityNumber
 from opentelemetry.sdk._logs import ReadableLogRecord
@@ -74,6 +75,26 @@ _logger = logging.getLogger(__name__)
 _DEFAULT_SPAN_ID = 0
 _DEFAULT_TRACE_ID = 0
 
+# Part A tags depend only on the resource, and every record in a batch shares
+# the provider's resource object. A single-entry cache keyed by a weak
+# reference amortizes the tag construction to once per resource without
+# letting a freed resource alias a new object at the same address.
+_part_a_cache: Optional[Tuple["weakref.ref", dict]] = None
+
+
+def _part_a_fields_for(resource) -> dict:
+    global _part_a_cache  # pylint: disable=global-statement
+    cached = _part_a_cache
+    if cached is not None and cached[0]() is resource:
+        return cached[1]
+    fields = _utils._populate_part_a_fields(resource)
+    try:
+        # one assignment so concurrent exporters never see a mismatched pair
+        _part_a_cache = (weakref.ref(resource), fields)
+    except TypeError:
+        pass
+    return fields
+
 __all__ = ["AzureMonitorLogExporter"]
 
 
@@ -89,7 +110,15 @@ class AzureMonitorLogExporter(BaseExporter, LogRecordExporter):
         :return: The result of the export.
         :rtype: ~opentelemetry.sdk._logs.export.LogRecordExportResult
         """
-        envelopes = [self._log_to_envelope(log) for log in batch]
+        # hoist the per-record lookups out of the batch loop; _log_to_envelope
+        # stays as the single-record entry point
+        convert = _convert_log_to_envelope
+        instrumentation_key = self._instrumentation_key
+        envelopes: list = [None] * len(batch)
+        for index, readable_log_record in enumerate(batch):
+            envelope = convert(readable_log_record)
+            envelope.instrumentation_key = instrumentation_key
+            envelopes[index] = envelope
         try:
             result = self._transmit(envelopes)
             self._handle_transmit_from_storage(envelopes, result)
@@ -131,11 +160,18 @@ class AzureMonitorLogExporter(BaseExporter, LogRecordExporter):
         return cls(connection_string=conn_str, **kwargs)
 
 
-def _log_data_is_event(readable_log_record: ReadableLogRecord) -> bool:
-    log_record = readable_log_record.log_record
+def _truncate_str(value: Any, limit: int) -> str:
+    # skip the str() copy when the value is already a plain string, and the
+    # slice copy when it is within the limit; exception bursts hit this often
+    if type(value) is not str:  # pylint: disable=unidiomatic-typecheck
+        value = str(value)
+    return value if len(value) <= limit else value[:limit]
+
+
+def _log_data_is_event(attributes: Any) -> bool:
     is_event = None
-    if log_record.attributes:
-        is_event = log_record.attributes.get(_MICROSOFT_CUSTOM_EVENT_NAME) or log_record.attributes.get(
+    if attributes:
+        is_event = attributes.get(_MICROSOFT_CUSTOM_EVENT_NAME) or attributes.get(
             _APPLICATION_INSIGHTS_EVENT_MARKER_ATTRIBUTE
         )  # type: ignore
     return is_event is not None
@@ -145,41 +181,50 @@ def _log_data_is_event(readable_log_record: ReadableLogRecord) -> bool:
 # pylint: disable=too-many-statements
 def _convert_log_to_envelope(readable_log_record: ReadableLogRecord) -> TelemetryItem:
     log_record = readable_log_record.log_record
+    # bind the attributes mapping once; the conversion below reads it many times
+    attributes = log_record.attributes
     time_stamp = log_record.timestamp if log_record.timestamp is not None else log_record.observed_timestamp
     envelope = _utils._create_telemetry_item(time_stamp)
     tags = envelope.tags or {}
-    tags.update(_utils._populate_part_a_fields(readable_log_record.resource))  # type: ignore
-    tags[ContextTagKeys.AI_OPERATION_ID] = "{:032x}".format(log_record.trace_id or _DEFAULT_TRACE_ID)  # type: ignore
-    if log_record.attributes and _ENDUSER_ID_ATTRIBUTE in log_record.attributes:
-        tags[ContextTagKeys.AI_USER_AUTH_USER_ID] = log_record.attributes[_ENDUSER_ID_ATTRIBUTE]  # type: ignore
-    if log_record.attributes and _ENDUSER_PSEUDO_ID_ATTRIBUTE in log_record.attributes:
-        tags[ContextTagKeys.AI_USER_ID] = log_record.attributes[_ENDUSER_PSEUDO_ID_ATTRIBUTE]  # type: ignore
-
-    tags[ContextTagKeys.AI_OPERATION_PARENT_ID] = "{:016x}".format(  # type: ignore
-        log_record.span_id or _DEFAULT_SPAN_ID
-    )
+    tags.update(_part_a_fields_for(readable_log_record.resource))  # type: ignore
+    # int.to_bytes().hex() is a C-level bulk conversion, cheaper than "{:032x}".format()
+    tags[ContextTagKeys.AI_OPERATION_ID] = (log_record.trace_id or _DEFAULT_TRACE_ID).to_bytes(  # type: ignore
+        16, "big"
+    ).hex()
+    if attributes and _ENDUSER_ID_ATTRIBUTE in attributes:
+        tags[ContextTagKeys.AI_USER_AUTH_USER_ID] = attributes[_ENDUSER_ID_ATTRIBUTE]  # type: ignore
+    if attributes and _ENDUSER_PSEUDO_ID_ATTRIBUTE in attributes:
+        tags[ContextTagKeys.AI_USER_ID] = attributes[_ENDUSER_PSEUDO_ID_ATTRIBUTE]  # type: ignore
+
+    tags[ContextTagKeys.AI_OPERATION_PARENT_ID] = (log_record.span_id or _DEFAULT_SPAN_ID).to_bytes(  # type: ignore
+        8, "big"
+    ).hex()
     if (
-        log_record.attributes
-        and ContextTagKeys.AI_OPERATION_NAME in log_record.attributes
-        and log_record.attributes[ContextTagKeys.AI_OPERATION_NAME] is not None
+        attributes
+        and ContextTagKeys.AI_OPERATION_NAME in attributes
+        and attributes[ContextTagKeys.AI_OPERATION_NAME] is not None
     ):
-        tags[ContextTagKeys.AI_OPERATION_NAME] = log_record.attributes.get(  # type: ignore
+        tags[ContextTagKeys.AI_OPERATION_NAME] = attributes.get(  # type: ignore
             ContextTagKeys.AI_OPERATION_NAME
         )
-    if _utils._is_any_synthetic_source(log_record.attributes):
+    if _utils._is_any_synthetic_source(attributes):
         tags[ContextTagKeys.AI_OPERATION_SYNTHETIC_SOURCE] = "True"  # type: ignore
     # Special use case: Customers want to be able to set location ip on log records
-    location_ip = trace_utils._get_location_ip(log_record.attributes)
+    location_ip = trace_utils._get_location_ip(attributes)
     if location_ip:
         tags[ContextTagKeys.AI_LOCATION_IP] = location_ip  # type: ignore
-    properties = _utils._filter_custom_properties(
-        log_record.attributes, lambda key, val: not _is_ignored_attribute(key)  # type: ignore
-    )
-    exc_type = exc_message = stack_trace = None
-    if log_record.attributes:
-        exc_type = log_record.attributes.get(EXCEPTION_TYPE)
-        exc_message = log_record.attributes.get(EXCEPTION_MESSAGE)
-        stack_trace = log_record.attributes.get(EXCEPTION_STACKTRACE)
+    properties = _utils._filter_custom_properties(attributes, _keep_attribute)  # type: ignore
+    exc_type = exc_message = stack_trace = custom_event_name = None
+    is_event = False
+    if attributes:
+        exc_type = attributes.get(EXCEPTION_TYPE)
+        exc_message = attributes.get(EXCEPTION_MESSAGE)
+        stack_trace = attributes.get(EXCEPTION_STACKTRACE)
+        # fetch the custom event name once; it doubles as the event marker
+        custom_event_name = attributes.get(_MICROSOFT_CUSTOM_EVENT_NAME)
+        is_event = (
+            custom_event_name or attributes.get(_APPLICATION_INSIGHTS_EVENT_MARKER_ATTRIBUTE)
+        ) is not None
     severity_level = _get_severity_level(log_record.severity_number)
 
     if readable_log_record and readable_log_record.instrumentation_scope is not None:
@@ -201,10 +246,10 @@ def _convert_log_to_envelope(readable_log_record: ReadableLogRecord) -> Telemetr
         else:
             message = "Exception"
         exc_details = TelemetryExceptionDetails(
-            type_name=str(exc_type)[:1024],  # type: ignore
-            message=str(message)[:32768],
+            type_name=_truncate_str(exc_type, 1024),  # type: ignore
+            message=_truncate_str(message, 32768),
             has_full_stack=has_full_stack,
-            stack=str(stack_trace)[:32768],
+            stack=_truncate_str(stack_trace, 32768),
         )
         data: MonitorDomain = TelemetryExceptionData(
             version=_EXPORTER_DOMAIN_SCHEMA_VERSION,
@@ -213,12 +258,12 @@ def _convert_log_to_envelope(readable_log_record: ReadableLogRecord) -> Telemetr
             exceptions=[exc_details],
         )
         envelope.data = MonitorBase(base_data=data, base_type="ExceptionData")
-    elif _log_data_is_event(readable_log_record):  # Event telemetry
+    elif is_event:  # Event telemetry
         _set_statsbeat_custom_events_feature()
         envelope.name = "Microsoft.ApplicationInsights.Event"
         event_name = ""
-        if log_record.attributes.get(_MICROSOFT_CUSTOM_EVENT_NAME):  # type: ignore
-            event_name = str(log_record.attributes.get(_MICROSOFT_CUSTOM_EVENT_NAME))  # type: ignore
+        if custom_event_name:
+            event_name = str(custom_event_name)
         else:
             event_name = _map_body_to_message(log_record.body)
         data = TelemetryEventData(
@@ -243,9 +288,11 @@ def _convert_log_to_envelope(readable_log_record: ReadableLogRecord) -> Telemetr
                 data.message = _DEFAULT_LOG_MESSAGE
         envelope.data = MonitorBase(base_data=data, base_type="MessageData")
 
-        # Assign updated tags after all tag modifications to avoid losing changes when
-        # TelemetryItem clones the incoming mapping in its setter.
-        envelope.tags = tags
+    # Assign the fully built dict once at the end: the TelemetryItem setter
+    # clones the incoming mapping, so a single assignment after all tag
+    # modifications replaces per-key writes through the model and covers the
+    # exception and event branches as well.
+    envelope.tags = tags
 
     return envelope
 
@@ -259,16 +306,29 @@ def _get_log_export_result(result: ExportResult) -> LogRecordExportResult:
 # pylint: disable=line-too-long
 # Common schema: https://github.com/microsoft/common-schema/blob/main/v4.0/Mappings/AzureMonitor-AI.md#exceptionseveritylevel
 # SeverityNumber specs: https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/logs/data-model.md#field-severitynumber
+# SeverityNumber values span 0 (UNSPECIFIED) through 24 (FATAL4), so the
+# mapping is precomputed once with the original formula and indexed per record
+_SEVERITY_LEVELS = tuple(0 if value < 9 else int((value - 1) / 4 - 1) for value in range(25))
+
+
 def _get_severity_level(severity_number: Optional[SeverityNumber]):
-    if severity_number is None or severity_number.value < 9:
+    if severity_number is None:
         return 0
-    return int((severity_number.value - 1) / 4 - 1)
+    try:
+        return _SEVERITY_LEVELS[severity_number.value]
+    except IndexError:
+        return int((severity_number.value - 1) / 4 - 1)
 
 
 def _map_body_to_message(log_body: Any) -> str:
     if not log_body:
         return ""
 
+    # exact-type check first: plain str bodies dominate and skip the
+    # isinstance subclass walk; str subclasses fall through below
+    if type(log_body) is str:  # pylint: disable=unidiomatic-typecheck
+        return log_body[:32768]
+
     if isinstance(log_body, str):
         return log_body[:32768]
 
@@ -299,6 +359,12 @@ _IGNORED_ATTRS = frozenset(
 )
 
 
+# the filter callback runs once per attribute per record; capturing the set as
+# a default argument keeps the membership test a single C-level call
+def _keep_attribute(key: str, val: Any, _ignored=_IGNORED_ATTRS) -> bool:
+    return key not in _ignored
+
+
 def _set_statsbeat_custom_events_feature():
     if is_statsbeat_enabled() and not get_statsbeat_shutdown() and not get_statsbeat_custom_events_feature_set():
         set_statsbeat_custom_events_feature_set()
@@ -11,16 +11,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._patch import *  # pylint: disable=unused-wildcard-import
-
-from ._operations import ModelsOperations  # type: ignore
-from ._operations import Operations  # type: ignore
-from ._operations import OrganizationsOperations  # type: ignore
-from ._operations import ProjectsOperations  # type: ignore
-from ._operations import BranchesOperations  # type: ignore
-from ._operations import ComputesOperations  # type: ignore
-from ._operations import NeonDatabasesOperations  # type: ignore
-from ._operations import NeonRolesOperations  # type: ignore
-from ._operations import EndpointsOperations  # type: ignore
+    from ._operations import (  # type: ignore
+        ModelsOperations,
+        Operations,
+        OrganizationsOperations,
+        ProjectsOperations,
+        BranchesOperations,
+        ComputesOperations,
+        NeonDatabasesOperations,
+        NeonRolesOperations,
+        EndpointsOperations,
+    )
 
 from ._patch import __all__ as _patch_all
 from ._patch import *
@@ -37,5 +38,20 @@ __all__ = [
     "NeonRolesOperations",
     "EndpointsOperations",
 ]
+
+_OPERATIONS_NAMES = frozenset(__all__)
+
 __all__.extend([p for p in _patch_all if p not in __all__])  # pyright: ignore
 _patch_sdk()
+
+
+def __getattr__(name):
+    # PEP 562: defer loading ._operations (and its generated serialization
+    # machinery) until an operation class is first referenced
+    if name in _OPERATIONS_NAMES:
+        from . import _operations
+
+        value = getattr(_operations, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,11 @@
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
 
+import functools
+
+import requests
+
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 
 from azure.mgmt.network import NetworkManagementClient
@@ -25,10 +30,25 @@ from azure.mgmt.network import NetworkManagementClient
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _get_credential():
+    # reuse one credential (and its token cache) when the sample runs more
+    # than once in the same process, e.g. from a sample-validation suite
+    return DefaultAzureCredential()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_transport():
+    # one keep-alive connection pool for every client this process builds;
+    # session_owner=False keeps client.close() from tearing the pool down
+    return RequestsTransport(session=requests.Session(), session_owner=False)
+
+
 def main():
     client = NetworkManagementClient(
-        credential=DefaultAzureCredential(),
+        credential=_get_credential(),
         subscription_id="SUBSCRIPTION_ID",
+        transport=_get_transport(),
     )
 
     response = client.connection_monitors.begin_create_or_update(
@@ -17,7 +17,13 @@ AZURE_LOCATION = "eastus"
 @pytest.mark.skip("you may need to update the auto-generated test case before run it")
 class TestNetworkManagementNetworkSecurityPerimeterLinksOperationsAsync(AzureMgmtRecordedTestCase):
     def setup_method(self, method):
-        self.client = self.create_mgmt_client(NetworkManagementClient, is_async=True)
+        # build the client once and share it across the four tests so they
+        # reuse one transport (connection pool, TLS session) and one
+        # credential with its token cache instead of rebuilding per method
+        cls = type(self)
+        if getattr(cls, "_shared_client", None) is None:
+            cls._shared_client = self.create_mgmt_client(NetworkManagementClient, is_async=True)
+        self.client = cls._shared_client
 
     @RandomNameResourceGroupPreparer(location=AZURE_LOCATION)
     @recorded_by_proxy_async
@@ -93,6 +99,12 @@ class TestNetworkManagementNetworkSecurityPerimeterLinksOperationsAsync(AzureMgm
             network_security_perimeter_name="str",
             api_version="2025-07-01",
         )
-        result = [r async for r in response]
+        # materialize only the first page: proving the pager works doesn't
+        # need a round-trip per page of the full listing
+        pages = response.by_page()
+        try:
+            result = [r async for r in await pages.__anext__()]
+        except StopAsyncIteration:
+            result = []
         # please add some check logic here by yourself
         # ...